@@ -0,0 +1,39 @@
+import asyncio
+import inspect
+
+from validate_call_safe import validate_call_safe, ErrorModel
+
+
+@validate_call_safe(validate_body=True, validate_return=True)
+async def fetch(a: int) -> int:
+    await asyncio.sleep(0)
+    if a == 0:
+        raise ZeroDivisionError("No zeroes please")
+    if a < 0:
+        return "negative"
+    return a
+
+
+assert inspect.iscoroutinefunction(fetch)
+
+
+async def main():
+    success = await fetch(a=1)
+    assert success == 1
+
+    bad_input = await fetch(a="A")  # Signature error
+    assert isinstance(bad_input, ErrorModel)
+    assert bad_input.error_type == "ValidationError"
+    assert bad_input.error_details[0]["loc"] == ("a",)
+
+    body_error = await fetch(a=0)  # Raised while the coroutine is awaited
+    assert isinstance(body_error, ErrorModel)
+    assert body_error.error_type == "ZeroDivisionError"
+
+    bad_return = await fetch(a=-1)  # Return validation error
+    assert isinstance(bad_return, ErrorModel)
+    assert bad_return.error_type == "ValidationError"
+    assert bad_return.error_details[0]["input"] == "negative"
+
+
+asyncio.run(main())
@@ -0,0 +1,64 @@
+from pydantic import BaseModel
+from pydantic_core import ArgsKwargs
+from validate_call_safe import validate_call_safe, ErrorModel
+
+
+class Event(BaseModel):
+    id: int
+    name: str
+
+
+@validate_call_safe(validate_body=True, validate_return=True)
+def process(event: Event, scale: int = 1) -> int:
+    if event.name == "boom":
+        raise RuntimeError("Exploded")
+    if event.id < 0:
+        return "negative"
+    return event.id * scale
+
+
+rows = [
+    ({"id": 1, "name": "a"},),  # Positional args
+    {"event": {"id": "2", "name": "b"}, "scale": 10},  # Keyword args
+    ({"id": "x", "name": "c"},),  # Invalid argument
+    ArgsKwargs(({"id": 3, "name": "boom"},)),  # Body error
+    ({"id": -1, "name": "d"},),  # Invalid return value
+    ({"id": 4, "name": "e"}, "2"),
+]
+results = process.map(rows)
+
+# Results are in the order of the rows, with the error models in place
+assert results[:2] == [1, 20]
+assert isinstance(results[2], ErrorModel)
+assert results[2].error_type == "ValidationError"
+assert results[2].error_details[0]["loc"] == (0, "id")
+assert isinstance(results[3], ErrorModel)
+assert results[3].error_type == "RuntimeError"
+assert isinstance(results[4], ErrorModel)
+assert results[4].error_details[0]["input"] == "negative"
+assert results[5] == 8
+
+# Each result is the same as calling the decorated function on the row (besides
+# the traceback, which shows the error raised from a different place)
+for row, result in zip(rows[:3], results):
+    single = process(**row) if isinstance(row, dict) else process(*row)
+    if isinstance(result, ErrorModel):
+        single, result = (m.model_dump(exclude={"error_tb"}) for m in (single, result))
+    assert single == result
+
+
+# Rows are reported as the calls would be
+messages = []
+
+
+@validate_call_safe(report=True, reporter=messages.append)
+def double(a: int) -> int:
+    return a * 2
+
+
+assert double.map([(1,), {"a": 2}]) == [2, 4]
+batch_messages = messages.copy()
+messages.clear()
+assert [double(1), double(a=2)] == [2, 4]
+assert messages == ["double received *(1,), **{}", "double received *(), **{'a': 2}"]
+assert batch_messages == messages
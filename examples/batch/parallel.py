@@ -0,0 +1,36 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from validate_call_safe import ErrorModel
+
+from examples.batch.workers import checksum, interned_checksum
+
+rows = [({"id": i, "name": "boom" if i % 7 == 0 else "ok"},) for i in range(50)]
+rows[3] = ({"id": "x", "name": "bad"},)
+expected = checksum.map(rows)
+
+assert isinstance(expected[0], ErrorModel)
+assert expected[0].error_type == "RuntimeError"
+assert isinstance(expected[3], ErrorModel)
+assert expected[3].error_type == "ValidationError"
+
+
+def without_tb(results):
+    return [
+        r.model_dump(exclude={"error_tb"}) if isinstance(r, ErrorModel) else r
+        for r in results
+    ]
+
+
+# Error models come back from the workers in place, without breaking the pool
+for executor in ["thread", "process"]:
+    results = checksum.map(rows, executor=executor, chunksize=8)
+    assert without_tb(results) == without_tb(expected)
+
+with ThreadPoolExecutor(max_workers=2) as pool:
+    results = checksum.map(rows, executor=pool)
+    assert without_tb(results) == without_tb(expected)
+
+# Interned (frozen) error models are pickled back from the workers too
+results = interned_checksum.map(rows, executor="process", chunksize=8)
+assert without_tb(results) == without_tb(interned_checksum.map(rows))
+assert results[0].model_config["frozen"]
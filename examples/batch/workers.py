@@ -0,0 +1,28 @@
+"""Functions for the `parallel` example, importable by worker processes."""
+
+from pydantic import BaseModel
+from validate_call_safe import validate_call_safe
+
+
+class Event(BaseModel):
+    id: int
+    name: str
+
+
+def compute(event: Event, rounds: int) -> int:
+    if event.name == "boom":
+        raise RuntimeError("Exploded")
+    total = event.id
+    for i in range(rounds):
+        total = (total * 31 + i) % 1_000_003
+    return total
+
+
+@validate_call_safe(validate_body=True)
+def checksum(event: Event, rounds: int = 1000) -> int:
+    return compute(event, rounds)
+
+
+@validate_call_safe(validate_body=True, intern=True)
+def interned_checksum(event: Event, rounds: int = 1000) -> int:
+    return compute(event, rounds)
@@ -0,0 +1,65 @@
+import asyncio
+
+from validate_call_safe import validate_call_safe, ErrorModel
+from validate_call_safe.caching import CachePolicy
+
+runs = []
+
+
+@validate_call_safe(validate_body=True, coalesce=True)
+async def fetch(key: int) -> str:
+    runs.append(key)
+    await asyncio.sleep(0.01)
+    if key < 0:
+        raise KeyError(key)
+    return f"value {key}"
+
+
+async def herd():
+    # Concurrent calls with equal validated arguments share one run of the body
+    results = await asyncio.gather(fetch(1), fetch("1"), fetch(key=1), fetch(2))
+    assert results == ["value 1", "value 1", "value 1", "value 2"]
+    assert runs == [1, 2]
+
+    # Every caller gets the error model of a shared error
+    errors = await asyncio.gather(fetch(-1), fetch(-1))
+    assert all(isinstance(e, ErrorModel) for e in errors)
+    assert errors[0].error_type == errors[1].error_type == "KeyError"
+    assert runs == [1, 2, -1]
+
+    # Once done, the next call runs the body again
+    assert await fetch(1) == "value 1"
+    assert runs == [1, 2, -1, 1]
+
+
+async def cancelled_waiter():
+    runs.clear()
+    first = asyncio.ensure_future(fetch(3))
+    second = asyncio.ensure_future(fetch(3))
+    await asyncio.sleep(0)
+    first.cancel()  # Doesn't cancel the run the second caller is waiting on
+    assert await second == "value 3"
+    assert first.cancelled()
+    assert runs == [3]
+
+
+@validate_call_safe(coalesce=True, cache=CachePolicy(ttl=0.05))
+async def fetch_cached(key: int) -> str:
+    runs.append(key)
+    await asyncio.sleep(0.01)
+    return f"value {key}"
+
+
+async def herd_with_ttl():
+    runs.clear()
+    await asyncio.gather(*(fetch_cached(4) for _ in range(10)))
+    await fetch_cached(4)  # Within the TTL: served from the cache
+    assert runs == [4]
+    await asyncio.sleep(0.05)
+    await fetch_cached(4)
+    assert runs == [4, 4]
+
+
+asyncio.run(herd())
+asyncio.run(cancelled_waiter())
+asyncio.run(herd_with_ttl())
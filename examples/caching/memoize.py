@@ -0,0 +1,119 @@
+import asyncio
+import time
+
+from pydantic import ConfigDict
+from validate_call_safe import validate_call_safe, ErrorModel
+from validate_call_safe.caching import CachePolicy
+
+calls = []
+
+
+@validate_call_safe(cache=True)
+def square(a: int, b: int = 0) -> int:
+    calls.append(a)
+    return a * a + b
+
+
+# The key is the validated arguments, so "2" and 2 (and a=2, and b's default) share it
+assert square(2) == 4
+assert square("2") == 4
+assert square(a=2) == 4
+assert square(2, b=0) == 4
+assert calls == [2]
+assert square.cache_info() == (3, 1, 0, 128, 1)  # hits, misses, evictions, max/currsize
+
+# Invalid arguments never reach the cache
+assert isinstance(square("A"), ErrorModel)
+assert square.cache_info().misses == 1
+
+square.cache_clear()
+assert square(2) == 4
+assert calls == [2, 2]
+assert square.cache_info().hits == 0
+
+# A small LRU with a TTL, and error models memoized in their own cache
+errors = CachePolicy(maxsize=10)
+
+
+@validate_call_safe(cache=CachePolicy(maxsize=2, ttl=0.05, errors=errors))
+def negate(a: int) -> int:
+    calls.append(a)
+    return -a
+
+
+calls.clear()
+assert [negate(1), negate(2), negate(3), negate(1)] == [-1, -2, -3, -1]
+assert calls == [1, 2, 3, 1]  # 1 was evicted by 3, the least recently used
+assert negate.cache_info().evictions == 2
+assert negate(1) == -1
+time.sleep(0.05)
+assert negate(1) == -1  # Expired
+assert calls == [1, 2, 3, 1, 1]
+
+first_error = negate("A")
+assert negate("A") is first_error  # The error model is not built again
+assert negate.error_cache_info().hits == 1
+
+
+# Only invalid arguments' error models are memoized: a body error may not recur
+attempts = []
+
+
+@validate_call_safe(validate_body=True, cache=CachePolicy(errors=CachePolicy()))
+def fetch_row(row_id: int) -> int:
+    attempts.append(row_id)
+    if len(attempts) == 1:
+        raise ConnectionError("Connection reset")
+    return row_id
+
+
+assert fetch_row(7).error_type == "ConnectionError"
+assert fetch_row(7) == 7  # The body ran again
+assert attempts == [7, 7]
+assert fetch_row.error_cache_info().currsize == 0
+
+
+# Error models are keyed on the arguments as passed, with their types, as `True == 1`
+@validate_call_safe(
+    config=ConfigDict(strict=True), cache=CachePolicy(errors=CachePolicy())
+)
+def strict_negate(a: int) -> int:
+    return -a
+
+
+assert isinstance(strict_negate(True), ErrorModel)
+assert strict_negate(1) == -1
+assert isinstance(strict_negate(a=True), ErrorModel)
+assert strict_negate(a=1) == -1
+
+
+# Unhashable arguments are simply not cached
+@validate_call_safe(cache=True)
+def total(a: list[int]) -> int:
+    return sum(a)
+
+
+assert total(["1", 2]) == 3
+assert total.cache_info().currsize == 0
+
+# Batches look up each row's validated arguments too
+calls.clear()
+assert square.map([(3,), ("3",), (2,)]) == [9, 9, 4]
+assert calls == [3]
+
+
+@validate_call_safe(cache=True)
+async def fetch(a: int) -> int:
+    calls.append(a)
+    await asyncio.sleep(0)
+    return a
+
+
+async def main():
+    assert await fetch(5) == 5
+    assert await fetch("5") == 5
+
+
+calls.clear()
+asyncio.run(main())
+assert calls == [5]
@@ -0,0 +1,57 @@
+from typing import Annotated
+
+from pydantic import AfterValidator, BaseModel
+from pydantic_core import PydanticCustomError
+from validate_call_safe import validate_call_safe, ErrorModel
+from validate_call_safe.engine import registry_info
+
+
+def known_user(name: str) -> str:
+    if name not in {"A", "B"}:
+        raise PydanticCustomError(
+            "unknown_user", "No user called {name}", {"name": name}
+        )
+    return name
+
+
+class Event(BaseModel):
+    user: Annotated[str, AfterValidator(known_user)]
+    count: int = 1
+
+
+before = registry_info()
+
+
+# The handlers have the same signature, so share one arguments validator (built for the
+# first of them) and one return validator
+@validate_call_safe(share=True, validate_return=True)
+def greet(event: Event, context: None = None) -> str:
+    return f"Hello {event.user}"
+
+
+@validate_call_safe(share=True, validate_return=True)
+def farewell(event: Event, context: None = None) -> str:
+    return f"Goodbye {event.user}"
+
+
+@validate_call_safe(validate_return=True)
+def unshared(event: Event, context: None = None) -> str:
+    return f"Goodbye {event.user}"
+
+
+info = registry_info()
+assert info.misses - before.misses == 2
+assert info.hits - before.hits == 2
+
+assert greet({"user": "A"}) == "Hello A"
+assert farewell({"user": "B"}) == "Goodbye B"
+
+# Errors are titled after the function called, just as they would be unshared
+for event in [{"user": "C"}, {"user": "A", "count": "many"}, {}]:
+    error = farewell(event)
+    assert isinstance(error, ErrorModel)
+    expected = unshared(event)
+    assert error.error_str == expected.error_str.replace("unshared", "farewell")
+    assert error.error_details == expected.error_details
+    assert error.error_str.startswith(f"{len(error.error_details)} validation error")
+    assert "for farewell" in error.error_str.splitlines()[0]
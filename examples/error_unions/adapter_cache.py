@@ -0,0 +1,41 @@
+from typing import Literal
+
+from pydantic import BaseModel
+from validate_call_safe import validate_call_safe
+from validate_call_safe.adapters import adapter_cache_clear, adapter_cache_info
+
+
+class ValidnFail(BaseModel):
+    error_type: Literal["ValidationError"]
+
+
+class AttribFail(BaseModel):
+    error_type: Literal["AttributeError"]
+
+
+FailUnion = ValidnFail | AttribFail
+
+adapter_cache_clear()
+
+
+@validate_call_safe(FailUnion)
+def int_noop(a: int) -> int:
+    return a
+
+
+@validate_call_safe(FailUnion)
+def str_noop(a: str) -> str:
+    return a
+
+
+# The union's adapter was built once, at decoration time, and then shared
+assert adapter_cache_info().misses == 1
+assert adapter_cache_info().hits == 1
+
+for _ in range(3):
+    failure = int_noop(a="A")
+    assert isinstance(failure, ValidnFail)
+
+# No further adapters are built (or looked up) on the error path
+assert adapter_cache_info().misses == 1
+assert adapter_cache_info().currsize == 1
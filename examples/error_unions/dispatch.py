@@ -0,0 +1,69 @@
+import warnings
+from typing import Literal
+
+from pydantic import BaseModel, ValidationError
+from validate_call_safe import validate_call_safe, ErrorModel
+from validate_call_safe.errors.dispatch import ErrorCoverageWarning, error_type_dispatch
+
+
+class UnknownKey(Exception):
+    pass
+
+
+class Invalid(BaseModel):
+    error_type: Literal["ValidationError"]
+    error_details: list
+
+
+class NoSuchKey(BaseModel):
+    error_type: Literal["UnknownKey", "IndexError"]
+    error_str: str
+
+
+# Every member has a `Literal` error type, so the error type picks the member
+assert error_type_dispatch(Invalid | NoSuchKey) == {
+    "ValidationError": Invalid,
+    "UnknownKey": NoSuchKey,
+    "IndexError": NoSuchKey,
+}
+# A member with a `str` error type could model any error, so there's no dispatch
+assert error_type_dispatch(Invalid | ErrorModel) is None
+
+# The union models every error that can be captured: no warning
+with warnings.catch_warnings():
+    warnings.simplefilter("error")
+
+    @validate_call_safe(
+        Invalid | NoSuchKey, validate_body=True, extra_exceptions=(UnknownKey,)
+    )
+    def lookup(table: dict[str, int], key: str) -> int:
+        if key not in table:
+            raise UnknownKey(key)
+        return table[key]
+
+
+assert isinstance(lookup({"a": 1}, "b"), NoSuchKey)
+assert lookup({"a": 1}, "b").error_str == "b"
+assert isinstance(lookup({"a": "A"}, "a"), Invalid)
+assert lookup({"a": 1}, "a") == 1
+
+# The union doesn't model every error that can be captured: warned when decorated
+with warnings.catch_warnings(record=True) as caught:
+    warnings.simplefilter("always")
+
+    @validate_call_safe(Invalid | NoSuchKey, validate_body=True)
+    def index(items: list[int], i: int) -> int:
+        assert i >= 0
+        return items[i]
+
+
+[warning] = caught
+assert warning.category is ErrorCoverageWarning
+assert "Exception (or a subclass)" in str(warning.message)
+assert isinstance(index([1], 1), NoSuchKey)  # IndexError
+try:
+    index([1], -1)
+except ValidationError:
+    pass  # The AssertionError is not modelled by the union
+else:
+    raise AssertionError("The AssertionError should not have been modelled")
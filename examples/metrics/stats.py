@@ -0,0 +1,63 @@
+import asyncio
+
+from validate_call_safe import validate_call_safe, ErrorModel
+from validate_call_safe import metrics
+
+
+@validate_call_safe(validate_body=True, metrics=True)
+def invert(a: int) -> float:
+    return 1 / a
+
+
+assert invert(2) == 0.5
+assert isinstance(invert("A"), ErrorModel)  # Signature error
+assert isinstance(invert(0), ErrorModel)  # Body error
+assert isinstance(invert(0), ErrorModel)
+
+stats = invert.__vcs_stats__
+snap = stats.snapshot()
+assert snap["calls"] == 4
+assert snap["successes"] == 1
+assert snap["validation_errors"] == 1
+assert snap["body_errors"] == {"ZeroDivisionError": 2}
+# The body only runs when the arguments are valid
+assert snap["body_time"]["count"] == 3
+assert snap["validation_time"]["count"] == 4
+
+# Batches count each row as a call
+results = invert.map([(1,), ("B",), (0,)])
+assert stats.calls == 7
+assert stats.successes == 2
+assert stats.validation_errors == 2
+assert stats.body_errors["ZeroDivisionError"] == 3
+
+
+@validate_call_safe(metrics=True)
+async def ainvert(a: int) -> float:
+    return 1 / a
+
+
+async def main():
+    assert await ainvert(4) == 0.25
+    assert isinstance(await ainvert("A"), ErrorModel)
+    try:
+        await ainvert(0)  # Raised, as `validate_body` is off
+    except ZeroDivisionError:
+        pass
+
+
+asyncio.run(main())
+assert ainvert.__vcs_stats__.snapshot()["raised"] == 1
+assert ainvert.__vcs_stats__.successes == 1
+
+# All the functions with metrics are in the registry
+assert metrics.registry[f"{__name__}.invert"] is stats
+text = metrics.prometheus_text()
+assert f'validate_call_safe_calls_total{{function="{__name__}.invert"}} 7' in text
+labels = f'function="{__name__}.invert",kind="body",error_type="ZeroDivisionError"'
+assert f"validate_call_safe_errors_total{{{labels}}} 3" in text
+assert f'body_time_seconds_count{{function="{__name__}.invert"}} 5' in text
+
+metrics.reset()
+assert stats.calls == 0
+assert stats.body_time.count == 0
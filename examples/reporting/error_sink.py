@@ -0,0 +1,91 @@
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Annotated
+
+from pydantic import AfterValidator
+from validate_call_safe import validate_call_safe, ErrorModel
+from validate_call_safe import sink
+
+errors = sink.enable(capacity=3)
+
+
+@validate_call_safe(validate_body=True)
+def parse_port(port: int) -> int:
+    if not 0 < port < 65536:
+        raise ValueError(f"Port out of range: {port}")
+    return port
+
+
+assert parse_port(8080) == 8080
+for bad in ["http", "ftp", 0, 70000]:
+    assert isinstance(parse_port(bad), ErrorModel)
+
+# The oldest error was overwritten, and nothing has been written yet
+assert len(errors) == 3
+
+with tempfile.TemporaryDirectory() as tmp:
+    path = Path(tmp) / "errors.jsonl"
+    assert sink.flush(path) == 3
+    assert len(errors) == 0 and errors.dropped == 1
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [r["function"] for r in records] == ["parse_port"] * 3
+    assert [r["error"]["error_type"] for r in records] == [
+        "ValidationError",
+        "ValueError",
+        "ValueError",
+    ]
+    assert records[-1]["error"]["error_str"] == "Port out of range: 70000"
+
+    # A background flusher appends to the file, and flushes what remains when stopped
+    flusher = errors.start_flusher(path, interval=60)
+    parse_port(-1)
+    assert flusher.stop() == 1
+    assert len(path.read_text().splitlines()) == 4
+
+
+def positive(n: int) -> int:
+    if n < 1:
+        raise ValueError("must be positive")
+    return n
+
+
+@validate_call_safe
+def retries(n: Annotated[int, AfterValidator(positive)]) -> int:
+    return n
+
+
+# An error model serialized by its own validator is written as it is
+@validate_call_safe(Annotated[ErrorModel, AfterValidator(ErrorModel.model_dump_json)])
+def timeout(seconds: float) -> float:
+    return seconds
+
+
+with tempfile.TemporaryDirectory() as tmp:
+    path = Path(tmp) / "errors.jsonl"
+    retries(0)  # The error's ctx holds the `ValueError`, which is written as its str
+    assert isinstance(timeout("never"), str)
+    assert sink.flush(path) == 2
+    value_error, timeout_error = [json.loads(line) for line in path.open()]
+    assert value_error["error"]["error_details"][0]["ctx"] == {
+        "error": "must be positive"
+    }
+    assert timeout_error["function"] == "timeout"
+    assert timeout_error["error"]["error_type"] == "ValidationError"
+
+    # A failed flush keeps the errors, and doesn't stop the background flusher
+    flusher = errors.start_flusher(
+        tmp, interval=0.01
+    )  # A directory, so can't be opened
+    retries(-1)
+    while not flusher.failures:
+        time.sleep(0.01)
+    assert len(errors) == 1
+    flusher.path = path  # Flushed by the thread or when stopped, whichever is first
+    flusher.stop()
+    assert len(path.read_text().splitlines()) == 3
+
+sink.disable()
+assert isinstance(parse_port("ssh"), ErrorModel)
+assert len(errors) == 0  # No longer pushed to
@@ -0,0 +1,68 @@
+import logging
+
+from validate_call_safe import validate_call_safe, ErrorModel
+from validate_call_safe.reporting import CallEvent, LoggingReporter
+
+
+class EventCollector:
+    def __init__(self):
+        self.enabled = True
+        self.events: list[CallEvent] = []
+
+    def is_enabled(self) -> bool:
+        return self.enabled
+
+    def report(self, event: CallEvent) -> None:
+        self.events.append(event)
+
+
+collector = EventCollector()
+
+
+@validate_call_safe(report=True, reporter=collector)
+def int_noop(a: int) -> int:
+    return a
+
+
+assert int_noop(1) == 1
+assert isinstance(int_noop(a="A"), ErrorModel)
+
+ok, bad = collector.events
+assert (ok.function, ok.args, ok.kwargs, ok.result, ok.outcome) == (
+    "int_noop",
+    (1,),
+    {},
+    1,
+    "success",
+)
+assert bad.kwargs == {"a": "A"}
+assert bad.outcome == "error"
+assert isinstance(bad.result, ErrorModel)
+assert ok.duration >= 0
+
+# When the reporter is disabled, no event is created at all
+collector.enabled = False
+assert int_noop(2) == 2
+assert len(collector.events) == 2
+
+
+# A logger which filters out the level never has the arguments formatted
+class Expensive:
+    reprs = 0
+
+    def __repr__(self):
+        Expensive.reprs += 1
+        return "Expensive()"
+
+
+logger = logging.getLogger("validate_call_safe.examples.structured")
+logger.setLevel(logging.WARNING)
+
+
+@validate_call_safe(report=True, reporter=LoggingReporter(logger, logging.DEBUG))
+def passthru(x: object) -> object:
+    return x
+
+
+passthru(Expensive())
+assert Expensive.reprs == 0
@@ -0,0 +1,50 @@
+import time
+
+from validate_call_safe import validate_call_safe, ErrorModel
+from validate_call_safe.reporting import ReportPolicy
+
+messages: list[str] = []
+
+
+@validate_call_safe(report="errors", reporter=messages.append)
+def int_noop(a: int) -> int:
+    return a
+
+
+assert int_noop(1) == 1
+assert messages == []  # Successes aren't reported
+assert isinstance(int_noop("A"), ErrorModel)
+received, returned = messages
+assert received == "int_noop received *('A',), **{}"
+assert returned.startswith("int_noop -> ErrorModel(")
+
+
+# Calls are only formatted once picked: the rest never have their arguments repr'd
+class Payload:
+    reprs = 0
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+
+    def __repr__(self):
+        Payload.reprs += 1
+        return f"Payload(delay={self.delay})"
+
+
+messages.clear()
+policy = ReportPolicy(slower_than=0.05, successes=10)
+
+
+@validate_call_safe(report=policy, reporter=messages.append)
+def handle(payload: object) -> float:
+    time.sleep(payload.delay)
+    return payload.delay
+
+
+for _ in range(20):
+    handle(Payload())  # The 1st and 11th are sampled
+handle(Payload(delay=0.06))  # Slow, so always reported
+
+assert len(messages) == 3 * 2
+assert Payload.reprs == 3
+assert messages[-2] == "handle received *(Payload(delay=0.06),), **{}"
@@ -0,0 +1,29 @@
+from validate_call_safe import validate_call_safe, ErrorModel
+
+
+# A canary: the return value of every 4th call is validated, catching the bug (returning
+# the wrong type) without validating every response
+@validate_call_safe(validate_return=True, validate_return_rate=4, metrics=True)
+def price(cents: int) -> float:
+    return f"${cents / 100:.2f}"  # Oops
+
+
+results = [price(i) for i in range(8)]
+sampled = [isinstance(result, ErrorModel) for result in results]
+assert sampled == [True, False, False, False] * 2
+assert results[1] == "$0.01"  # Unsampled calls are not validated
+
+# Sampled failures are captured (and counted, and reported) like any other error
+stats = price.__vcs_stats__.snapshot()
+assert stats["validation_errors"] == 2
+assert stats["successes"] == 6
+
+
+# A fraction samples calls at random instead
+@validate_call_safe(validate_return=True, validate_return_rate=0.0)
+def never_checked(a: int) -> int:
+    return "not an int"
+
+
+assert never_checked(1) == "not an int"
+assert isinstance(never_checked("not an int either"), ErrorModel)
@@ -0,0 +1,44 @@
+from pydantic import BaseModel
+from validate_call_safe import validate_call_safe
+from validate_call_safe.errors.inputs import DetailsPolicy
+
+
+def total(counts: dict[str, int]) -> int:
+    return sum(counts.values())
+
+
+payload = list(range(1000))  # Not a dict, so the whole payload is the invalid input
+
+# By default, the offending input is kept in each error detail as is
+[detail] = validate_call_safe(total)(payload).error_details
+assert detail["input"] is payload
+
+[detail] = validate_call_safe(details="drop")(total)(payload).error_details
+assert detail["input"] is None
+
+[detail] = validate_call_safe(details="type")(total)(payload).error_details
+assert detail["input"] == "list"
+
+[detail] = validate_call_safe(details="truncate")(total)(payload).error_details
+assert detail["input"] == repr(payload)[:97] + "..."
+
+short = DetailsPolicy("truncate", max_length=10)
+[detail] = validate_call_safe(details=short)(total)([1]).error_details
+assert detail["input"] == "[1]"  # Short enough already
+
+
+# The URL and context of each error detail can be left out too
+class RawErrorModel(BaseModel):
+    error_type: str
+    error_details: list[dict]
+
+
+def bounded(n: int, items: list[int]):
+    return items[:n]
+
+
+[detail] = validate_call_safe(RawErrorModel)(bounded)(1, 1).error_details
+assert set(detail) == {"type", "loc", "msg", "input", "url"}
+lean = DetailsPolicy(include_url=False, include_context=False)
+[detail] = validate_call_safe(RawErrorModel, details=lean)(bounded)(1, 1).error_details
+assert set(detail) == {"type", "loc", "msg", "input"}
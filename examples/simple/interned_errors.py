@@ -0,0 +1,44 @@
+import pickle
+
+from pydantic import ValidationError
+from validate_call_safe import validate_call_safe, ErrorModel
+
+
+@validate_call_safe(validate_body=True, intern=True)
+def ratio(a: int, b: int) -> float:
+    return a / b
+
+
+first = ratio("A", 1)
+again = ratio("B", 2)  # Same shape of error: an invalid `a`
+other = ratio(1, "B")  # A different shape: an invalid `b`
+
+# Repeats share the error model built for the first occurrence
+assert again is first
+assert other is not first
+assert isinstance(first, ErrorModel)
+assert first.error_details[0]["input"] == "A"  # From the first occurrence
+
+# Shared error models are frozen, so can't be changed by one of the callers
+try:
+    first.error_type = "Changed"
+except ValidationError:
+    pass
+else:
+    raise AssertionError("Interned error models should be frozen")
+
+# They pickle (e.g. to be sent between processes), unpickling as a frozen error model
+assert type(first).__name__ == "FrozenErrorModel"
+unpickled = pickle.loads(pickle.dumps(first))
+assert type(unpickled) is type(first)
+assert unpickled == first
+
+# Other errors are fingerprinted by their type and message
+assert ratio(1, 0) is ratio(2, 0)
+
+interner = ratio.__vcs_interner__
+counts = sorted(interner.counts().values())
+assert counts == [1, 2, 2]
+
+interner.clear()
+assert ratio("A", 1) is not first
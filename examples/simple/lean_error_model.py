@@ -0,0 +1,40 @@
+from typing import Annotated
+
+from pydantic import AfterValidator, BaseModel
+from validate_call_safe import validate_call_safe, ErrorDetails, ErrorModel
+from validate_call_safe.errors.fields import error_model_fields
+
+
+class LeanErrorModel(BaseModel):
+    error_type: str
+    error_details: list[ErrorDetails]
+
+
+class TracedErrorModel(BaseModel):
+    error_type: str
+    error_tb: str
+
+
+# Only these fields get computed when an error is captured (no traceback formatting)
+assert error_model_fields(LeanErrorModel) == {"error_type", "error_details"}
+# Annotated models are unwrapped, and the fields of Union members are pooled
+LeanJson = Annotated[LeanErrorModel, AfterValidator(LeanErrorModel.model_dump_json)]
+assert error_model_fields(LeanJson) == {"error_type", "error_details"}
+assert error_model_fields(LeanErrorModel | TracedErrorModel) == {
+    "error_type",
+    "error_details",
+    "error_tb",
+}
+assert error_model_fields(ErrorModel) == set(ErrorModel.model_fields)
+
+
+@validate_call_safe(LeanErrorModel)
+def int_noop(a: int) -> int:
+    return a
+
+
+failure = int_noop(a="A")
+
+assert isinstance(failure, LeanErrorModel)
+assert failure.error_type == "ValidationError"
+assert failure.error_details[0]["loc"] == ("a",)
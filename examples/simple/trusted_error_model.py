@@ -0,0 +1,58 @@
+from pydantic import BaseModel, field_validator
+from validate_call_safe import validate_call_safe, ErrorModel
+
+
+def int_noop(a: int) -> int:
+    return a
+
+
+validated_noop = validate_call_safe(int_noop)
+trusted_noop = validate_call_safe(validate_error=False)(int_noop)
+
+# The error model is constructed from the same data, just without validating it
+validated = validated_noop(a="A")
+trusted = trusted_noop(a="A")
+assert isinstance(trusted, ErrorModel)
+assert trusted.error_details == validated.error_details
+tb_free = {"error_tb"}
+assert trusted.model_dump(exclude=tb_free) == validated.model_dump(exclude=tb_free)
+assert trusted.model_dump_json(exclude=tb_free) == validated.model_dump_json(
+    exclude=tb_free
+)
+
+
+class CodedError(BaseModel):
+    error_type: str
+    error_str: str
+
+    @property
+    def code(self) -> int:
+        return 400 if self.error_type == "ValidationError" else 500
+
+
+@validate_call_safe(CodedError, validate_body=True, validate_error=False)
+def invert(a: int) -> float:
+    return 1 / a
+
+
+assert invert(0).code == 500
+assert invert("A").code == 400
+
+
+class RedactedError(BaseModel):
+    error_type: str
+    error_str: str
+
+    @field_validator("error_str")
+    @classmethod
+    def redact(cls, error_str: str) -> str:
+        return "<redacted>"
+
+
+# A model with validators is still validated, so they aren't skipped
+@validate_call_safe(RedactedError, validate_body=True, validate_error=False)
+def secret(token: str) -> str:
+    raise PermissionError(f"Bad token: {token}")
+
+
+assert secret("hunter2").error_str == "<redacted>"
@@ -0,0 +1,59 @@
+"""Error-path throughput, building the error model with and without validating it,
+and reusing the error model of a repeated error.
+
+The data an error model is built from is produced by pydantic (or the exception) just
+before, so `validate_error=False` constructs a plain model class from it as trusted.
+With `intern=True` an error of the same shape as an earlier one (as in an error storm
+from one misbehaving client) returns that error's model, without building another.
+"""
+
+import timeit
+from functools import partial
+
+from pydantic import BaseModel
+from validate_call_safe import validate_call_safe, ErrorDetails
+
+
+class Event(BaseModel):
+    id: int
+    name: str
+    tags: list[int]
+
+
+class LeanErrorModel(BaseModel):
+    error_type: str
+    error_details: list[ErrorDetails]
+
+
+def service(event: Event) -> dict:
+    return {"processed": True, "event_id": event.id}
+
+
+validated_service = validate_call_safe(service)
+trusted_service = validate_call_safe(validate_error=False)(service)
+validated_lean_service = validate_call_safe(LeanErrorModel)(service)
+trusted_lean_service = validate_call_safe(LeanErrorModel, validate_error=False)(service)
+interned_service = validate_call_safe(intern=True)(service)
+
+# Every error in the details is validated again when the error model is validated
+invalid_event = {"id": "not an int", "name": None, "tags": ["a", "b", "c", "d", "e"]}
+
+
+def run_benchmarks(num_iterations=5000, rounds=5):
+    services = {
+        "validated_service": validated_service,
+        "trusted_service": trusted_service,
+        "validated_lean_service": validated_lean_service,
+        "trusted_lean_service": trusted_lean_service,
+        "interned_service": interned_service,
+    }
+    print(f"{'Service Type':<35} {'Invalid calls/s':<15}")
+    print("-" * 50)
+    for name, func in services.items():
+        call = partial(func, invalid_event)
+        elapsed = min(timeit.repeat(call, number=num_iterations, repeat=rounds))
+        print(f"{name:<35} {num_iterations / elapsed:<15.0f}")
+
+
+if __name__ == "__main__":
+    run_benchmarks()
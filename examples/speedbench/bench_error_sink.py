@@ -0,0 +1,56 @@
+"""Throughput of invalid calls whose errors are reported by writing them to a log file
+as they happen (`report="errors"` with a file's `print`), pushed into the error sink's
+ring buffer (and flushed to a JSONL file in bulk after each timing), or neither.
+"""
+
+import os
+import tempfile
+import timeit
+from functools import partial
+from pathlib import Path
+
+from validate_call_safe import validate_call_safe, sink
+
+
+def handle(port: int) -> int:
+    return port
+
+
+def run_benchmarks(num_iterations=2000, rounds=15):
+    tmp = Path(tempfile.mkdtemp())
+    log = open(tmp / "errors.log", "a", buffering=1)  # Line buffered, as a log would be
+    log_print = partial(print, file=log)
+    services = {
+        "no_reporting": validate_call_safe(traceback="none")(handle),
+        "report_to_file": validate_call_safe(
+            traceback="none", report="errors", reporter=log_print
+        )(handle),
+        "error_sink": validate_call_safe(traceback="none")(handle),
+        "error_sink_with_flush": validate_call_safe(traceback="none")(handle),
+    }
+    print(f"{'Service Type':<35} {'Invalid calls/s':<15}")
+    print("-" * 50)
+    best = {name: float("inf") for name in services}
+    # The services are timed in turn each round, so they share any noise
+    for _ in range(rounds):
+        for name, service in services.items():
+            if name.startswith("error_sink"):
+                sink.enable(capacity=num_iterations)
+            call = partial(service, "not a port")
+            elapsed = timeit.timeit(call, number=num_iterations)
+            if name == "error_sink_with_flush":
+                elapsed += timeit.timeit(
+                    partial(sink.flush, tmp / "errors.jsonl"), number=1
+                )
+            sink.disable()
+            best[name] = min(best[name], elapsed)
+    for name, elapsed in best.items():
+        print(f"{name:<35} {num_iterations / elapsed:<15.0f}")
+    log.close()
+    for path in tmp.iterdir():
+        os.remove(path)
+    tmp.rmdir()
+
+
+if __name__ == "__main__":
+    run_benchmarks()
@@ -0,0 +1,119 @@
+"""Error-path throughput with a `Union` error model, before and after adapter caching,
+and the cost of picking the union member for an error.
+
+The "before" service reproduces the old wrapper, which built a fresh `TypeAdapter`
+for the union on every failed call, while the "after" service is the decorator as is.
+
+When every member has a `Literal` error type, the decorator validates the member for the
+error type directly, rather than the union (whose members are tried left to right).
+"""
+
+import timeit
+from functools import partial
+from typing import Literal, Union
+
+from pydantic import (
+    BaseModel,
+    TypeAdapter,
+    ValidationError,
+    create_model,
+    validate_call,
+)
+from validate_call_safe import validate_call_safe, ErrorDetails, ErrorModel
+from validate_call_safe.errors.dispatch import error_type_dispatch
+
+
+class Event(BaseModel):
+    id: int
+    name: str
+
+
+class ValidnFail(BaseModel):
+    error_type: Literal["ValidationError"]
+
+
+class AttribFail(BaseModel):
+    error_type: Literal["AttributeError"]
+
+
+FailUnion = ValidnFail | AttribFail | ErrorModel
+
+
+@validate_call
+def _validated_service(event: Event) -> dict:
+    return {"processed": True, "event_id": event.id}
+
+
+def uncached_union_service(event_data: dict):
+    try:
+        return _validated_service(event_data)
+    except ValidationError as e:
+        ret = ErrorModel.model_validate(
+            dict(
+                error_type="ValidationError",
+                error_details=e.errors(),
+                error_str=str(e),
+                error_repr=repr(e),
+                error_tb="",
+            ),
+        )
+        return TypeAdapter(FailUnion).validate_python(ret.model_dump())
+
+
+@validate_call_safe(FailUnion)
+def cached_union_service(event: Event) -> dict:
+    return {"processed": True, "event_id": event.id}
+
+
+invalid_event = {"id": "not an int", "name": "Invalid Event"}
+
+
+def run_benchmarks(num_iterations=2000):
+    print(f"{'Service Type':<35} {'Invalid calls/s':<15}")
+    print("-" * 50)
+    for service in [uncached_union_service, cached_union_service]:
+        elapsed = timeit.timeit(partial(service, invalid_event), number=num_iterations)
+        print(f"{service.__name__:<35} {num_iterations / elapsed:<15.0f}")
+
+
+error_types = [
+    "ValidationError",
+    "AttributeError",
+    "KeyError",
+    "IndexError",
+    "TypeError",
+    "ValueError",
+]
+LiteralUnion = Union[
+    tuple(
+        create_model(
+            error_type.replace("Error", "Fail"),
+            error_type=(Literal[error_type], ...),
+            error_details=(list[ErrorDetails], ...),
+            error_str=(str, ...),
+        )
+        for error_type in error_types
+    )
+]
+# The last member's error type, so the union tries every member before it
+error_data = {"error_type": "ValueError", "error_details": [], "error_str": "Bad value"}
+
+
+def run_dispatch_benchmarks(num_iterations=20000):
+    union_validate = TypeAdapter(LiteralUnion).validate_python
+    dispatch = error_type_dispatch(LiteralUnion)
+
+    def dispatch_validate(data):
+        return dispatch[data["error_type"]].model_validate(data)
+
+    print(f"{'Union validation':<35} {'Errors/s':<15}")
+    print("-" * 50)
+    for name, validate in [("union", union_validate), ("dispatch", dispatch_validate)]:
+        elapsed = timeit.timeit(partial(validate, error_data), number=num_iterations)
+        print(f"{name:<35} {num_iterations / elapsed:<15.0f}")
+
+
+if __name__ == "__main__":
+    run_benchmarks()
+    print()
+    run_dispatch_benchmarks()
@@ -0,0 +1,55 @@
+"""Throughput of calling a decorated function on a JSON request, parsing it with
+`json.loads` first or validating the arguments straight from the JSON with `call_json`.
+"""
+
+import json
+import timeit
+from functools import partial
+
+from pydantic import BaseModel
+from validate_call_safe import validate_call_safe
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+    price: float
+    tags: list[str]
+
+
+class Order(BaseModel):
+    customer: str
+    items: list[Item]
+
+
+@validate_call_safe
+def total(order: Order) -> float:
+    return sum(item.price for item in order.items)
+
+
+items = [
+    {"id": i, "name": f"item {i}", "price": i * 1.5, "tags": ["a", "b"]}
+    for i in range(50)
+]
+request = json.dumps({"order": {"customer": "A", "items": items}}).encode()
+
+
+def loads_then_call(raw: bytes) -> float:
+    return total(**json.loads(raw))
+
+
+def run_benchmarks(num_iterations=2000, rounds=5):
+    assert loads_then_call(request) == total.call_json(request)
+    print(f"{'Service Type':<35} {'Requests/s':<15}")
+    print("-" * 50)
+    for name, service in [
+        ("json_loads_then_call", loads_then_call),
+        ("call_json", total.call_json),
+    ]:
+        call = partial(service, request)
+        elapsed = min(timeit.repeat(call, number=num_iterations, repeat=rounds))
+        print(f"{name:<35} {num_iterations / elapsed:<15.0f}")
+
+
+if __name__ == "__main__":
+    run_benchmarks()
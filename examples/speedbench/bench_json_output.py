@@ -0,0 +1,78 @@
+"""Throughput of a decorated function returning JSON, serializing its results and error
+models with `AfterValidator`s (as in `simple_service.py`) or with `output="json"`.
+"""
+
+import timeit
+from functools import partial
+from typing import Annotated
+
+from pydantic import AfterValidator, BaseModel
+from validate_call_safe import validate_call_safe, ErrorModel
+from validate_call_safe.output import JsonOutput
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+    price: float
+
+
+class Basket(BaseModel):
+    items: list[Item]
+
+
+fields = {"error_type", "error_details"}
+ErrorModelJson = Annotated[
+    ErrorModel,
+    AfterValidator(lambda m: ErrorModel.model_dump_json(m, include=fields)),
+]
+BasketJson = Annotated[Basket, AfterValidator(Basket.model_dump_json)]
+
+
+@validate_call_safe(ErrorModelJson, validate_return=True, traceback="none")
+def after_validator(basket: Basket) -> BasketJson:
+    return basket
+
+
+@validate_call_safe(output=JsonOutput(include=fields), traceback="none")
+def json_output(basket: Basket) -> Basket:
+    return basket
+
+
+@validate_call_safe(
+    output=JsonOutput(include=fields), traceback="none", validate_error=False
+)
+def json_output_trusted(basket: Basket) -> Basket:
+    return basket
+
+
+items = [{"id": i, "name": f"item {i}", "price": i * 1.5} for i in range(20)]
+valid = {"items": items}
+invalid = {"items": [*items[:-1], {"id": "x"}]}
+
+
+def run_benchmarks(num_iterations=1000, rounds=30):
+    for basket in (valid, invalid):
+        expected = after_validator(basket).encode()
+        assert json_output(basket) == json_output_trusted(basket) == expected
+    print(f"{'Service Type':<35} {'Calls/s':<15}")
+    print("-" * 50)
+    services = [
+        ("after_validator", after_validator),
+        ("output_json", json_output),
+        ("output_json_trusted", json_output_trusted),
+    ]
+    for path, basket in [("valid", valid), ("invalid", invalid)]:
+        # The services are timed in turn each round, so they share any noise
+        best = {name: float("inf") for name, _ in services}
+        for _ in range(rounds):
+            for name, service in services:
+                call = partial(service, basket)
+                elapsed = timeit.timeit(call, number=num_iterations)
+                best[name] = min(best[name], elapsed)
+        for name, elapsed in best.items():
+            print(f"{f'{name} ({path})':<35} {num_iterations / elapsed:<15.0f}")
+
+
+if __name__ == "__main__":
+    run_benchmarks()
@@ -0,0 +1,46 @@
+"""Memory retained by error models captured from calls with large invalid payloads.
+
+Each error detail holds the invalid input itself, so a queue of error models keeps every
+rejected payload alive. The `details` policy bounds what each error model retains.
+"""
+
+import gc
+import tracemalloc
+
+from validate_call_safe import validate_call_safe
+
+
+def ingest(records: dict[str, int]) -> int:
+    return len(records)
+
+
+policies = ["keep", "drop", "type", "truncate"]
+services = {policy: validate_call_safe(details=policy)(ingest) for policy in policies}
+
+
+def make_payload(size=1000):
+    """A payload of the wrong type (a list, not a dict) so it is all the invalid input."""
+    return [{"id": i, "name": f"record {i}"} for i in range(size)]
+
+
+def retained_kib(service, num_errors=100):
+    gc.collect()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    error_models = [service(make_payload()) for _ in range(num_errors)]
+    gc.collect()
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del error_models
+    return (end - start) / num_errors / 1024
+
+
+def run_benchmarks():
+    print(f"{'Details policy':<35} {'KiB per error model':<15}")
+    print("-" * 55)
+    for policy, service in services.items():
+        print(f"{policy:<35} {retained_kib(service):<15.1f}")
+
+
+if __name__ == "__main__":
+    run_benchmarks()
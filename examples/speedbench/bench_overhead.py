@@ -0,0 +1,77 @@
+"""Per-call overhead of `validate_call_safe` over `validate_call` on the happy path.
+
+The decorated functions do nothing but return their (validated) argument, so that the
+difference between the two decorators is as large a share of the call time as it can be.
+"""
+
+import timeit
+
+from pydantic import validate_call
+from validate_call_safe import validate_call_safe
+
+
+@validate_call
+def validate_call_noop(a: int) -> int:
+    return a
+
+
+@validate_call_safe
+def safe_noop(a: int) -> int:
+    return a
+
+
+@validate_call_safe(validate_body=True)
+def safe_body_noop(a: int) -> int:
+    return a
+
+
+@validate_call_safe(engine="core")
+def safe_core_noop(a: int) -> int:
+    return a
+
+
+@validate_call_safe(engine="core", validate_return=True)
+def safe_core_return_noop(a: int) -> int:
+    return a
+
+
+@validate_call_safe(validate_return=True)
+def safe_return_noop(a: int) -> int:
+    return a
+
+
+@validate_call_safe(report=True, reporter=lambda msg: None)
+def safe_report_noop(a: int) -> int:
+    return a
+
+
+def per_call_ns(func, num_iterations=20000):
+    elapsed = timeit.timeit(lambda: func(1), number=num_iterations)
+    return elapsed / num_iterations * 1e9
+
+
+def run_benchmarks(rounds=25):
+    funcs = [
+        validate_call_noop,
+        safe_noop,
+        safe_body_noop,
+        safe_report_noop,
+        safe_core_noop,
+        safe_return_noop,
+        safe_core_return_noop,
+    ]
+    # Interleave the rounds and keep the best of each, to smooth out machine noise
+    best = {func: min(per_call_ns(func) for _ in range(3)) for func in funcs}
+    for _ in range(rounds):
+        for func in funcs:
+            best[func] = min(best[func], per_call_ns(func))
+    baseline = best[validate_call_noop]
+    print(f"{'Decorator':<35} {'ns/call':<15} {'Overhead':<15}")
+    print("-" * 65)
+    for func in funcs:
+        overhead = f"{best[func] / baseline - 1:.0%}" if func is not funcs[0] else "-"
+        print(f"{func.__name__:<35} {best[func]:<15.0f} {overhead:<15}")
+
+
+if __name__ == "__main__":
+    run_benchmarks()
@@ -0,0 +1,67 @@
+"""Throughput of a function taking an order of 20 items, reporting every call (whose
+messages format the order), only those a `ReportPolicy` picks after the call, or none.
+"""
+
+import timeit
+from functools import partial
+
+from pydantic import BaseModel
+from validate_call_safe import validate_call_safe
+from validate_call_safe.reporting import ReportPolicy
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+    price: float
+
+
+class Order(BaseModel):
+    customer: str
+    items: list[Item]
+
+
+ORDER = {
+    "customer": "alice",
+    "items": [{"id": i, "name": f"item {i}", "price": i * 1.5} for i in range(20)],
+}
+
+
+def discard(message: str) -> None:
+    pass
+
+
+def total(order: Order) -> float:
+    return sum(item.price for item in order.items)
+
+
+def reporting(report) -> object:
+    return validate_call_safe(report=report, reporter=discard, validate_return=True)(
+        total
+    )
+
+
+services = {
+    "report=True": reporting(True),
+    "ReportPolicy(successes=100)": reporting(ReportPolicy(successes=100)),
+    "ReportPolicy(slower_than=0.01)": reporting(ReportPolicy(slower_than=0.01)),
+    'report="errors"': reporting("errors"),
+    "report=False": reporting(False),
+}
+
+
+def run_benchmarks(num_iterations=2000, rounds=15):
+    print(f"{'Service Type':<35} {'Calls/s':<15}")
+    print("-" * 50)
+    best = {name: float("inf") for name in services}
+    # The services are timed in turn each round, so they share any noise
+    for _ in range(rounds):
+        for name, service in services.items():
+            call = partial(service, ORDER)
+            best[name] = min(best[name], timeit.timeit(call, number=num_iterations))
+    for name, elapsed in best.items():
+        print(f"{name:<35} {num_iterations / elapsed:<15.0f}")
+
+
+if __name__ == "__main__":
+    run_benchmarks()
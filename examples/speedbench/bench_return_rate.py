@@ -0,0 +1,52 @@
+"""Throughput of a function returning rows as a list of models, validating its return
+value on every call, on a sample of calls (`validate_return_rate`), or never.
+"""
+
+import timeit
+from functools import partial
+
+from pydantic import BaseModel
+from validate_call_safe import validate_call_safe
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+    price: float
+
+
+ROWS = [{"id": i, "name": f"item {i}", "price": i * 1.5} for i in range(100)]
+
+
+def items(n: int) -> list[Item]:
+    # Rows (e.g. from a database) which return validation turns into models
+    return ROWS[:n]
+
+
+services = {
+    "validate_return": validate_call_safe(validate_return=True)(items),
+    "validate_return_rate=0.1": validate_call_safe(
+        validate_return=True, validate_return_rate=0.1
+    )(items),
+    "validate_return_rate=100": validate_call_safe(
+        validate_return=True, validate_return_rate=100
+    )(items),
+    "no_return_validation": validate_call_safe(items),
+}
+
+
+def run_benchmarks(num_iterations=2000, rounds=15):
+    print(f"{'Service Type':<35} {'Calls/s':<15}")
+    print("-" * 50)
+    best = {name: float("inf") for name in services}
+    # The services are timed in turn each round, so they share any noise
+    for _ in range(rounds):
+        for name, service in services.items():
+            call = partial(service, 20)
+            best[name] = min(best[name], timeit.timeit(call, number=num_iterations))
+    for name, elapsed in best.items():
+        print(f"{name:<35} {num_iterations / elapsed:<15.0f}")
+
+
+if __name__ == "__main__":
+    run_benchmarks()
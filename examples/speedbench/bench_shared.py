@@ -0,0 +1,76 @@
+"""Decorating N handlers with the same signature (in a new process for each mode): the
+time taken, and the memory the process grows by, with and without shared validators.
+"""
+
+import subprocess
+import sys
+
+DECORATE = """
+import resource
+from time import perf_counter
+
+from pydantic import BaseModel
+from validate_call_safe import validate_call_safe
+
+
+class Pet(BaseModel):
+    name: str
+    age: int
+
+
+class Person(BaseModel):
+    name: str
+    pets: list[Pet] = []
+
+
+class Event(BaseModel):
+    user: Person
+
+
+def make_handler(i):
+    def handler(event: Event, context: None = None) -> list[Pet]:
+        return event.user.pets
+
+    handler.__name__ = handler.__qualname__ = f"handler_{{i}}"
+    return handler
+
+
+decorate = validate_call_safe({kwargs})
+handlers = [make_handler(i) for i in range({n})]
+start_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = perf_counter()
+handlers = [decorate(handler) for handler in handlers]
+elapsed = perf_counter() - start
+grown_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - start_kib
+print(elapsed, grown_kib)
+"""
+
+
+def decorate_handlers(n, kwargs, rounds=3):
+    """The best time taken and memory grown over several processes."""
+    code = DECORATE.format(n=n, kwargs=kwargs)
+    results = []
+    for _ in range(rounds):
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        results.append(tuple(map(float, out.split())))
+    return min(r[0] for r in results), min(r[1] for r in results)
+
+
+def run_benchmarks(num_handlers=(100, 1000)):
+    print(f"{'Mode':<35} {'Decorate (ms)':<15} {'Memory (MiB)':<15}")
+    print("-" * 65)
+    for n in num_handlers:
+        for name, kwargs in [
+            ("validate_call", "validate_return=True"),
+            ("core", "validate_return=True, engine='core'"),
+            ("core, shared", "validate_return=True, share=True"),
+        ]:
+            elapsed, grown_kib = decorate_handlers(n, kwargs)
+            label = f"{n} handlers, {name}"
+            print(f"{label:<35} {elapsed * 1e3:<15.1f} {grown_kib / 1024:<15.1f}")
+
+
+if __name__ == "__main__":
+    run_benchmarks()
@@ -84,5 +84,23 @@ def run_benchmarks():
         )
 
 
+def run_batch_benchmarks(num_rows=10000):
+    print(f"\nBatch of {num_rows} rows (90% valid)")
+    print(f"{'Approach':<35} {'Time (s)':<15}")
+    print("-" * 50)
+    rows = [(invalid_event if i % 10 == 0 else valid_event,) for i in range(num_rows)]
+
+    def loop():
+        return [validate_call_safe_service(*row) for row in rows]
+
+    def batch():
+        return validate_call_safe_service.map(rows)
+
+    for approach in [loop, batch]:
+        elapsed = timeit.timeit(approach, number=1)
+        print(f"{approach.__name__:<35} {elapsed:<15.3f}")
+
+
 if __name__ == "__main__":
     run_benchmarks()
+    run_batch_benchmarks()
@@ -0,0 +1,97 @@
+"""Cold start: the time to import a module of N decorated handlers (in a new process),
+building their validators when decorated or deferring them with `defer=True`, then the
+time to warm all of them up (or to call the first handler, which builds only its own).
+"""
+
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+HANDLER = """
+@validate_call_safe(defer=DEFER, validate_body=True)
+def handler_{i}(event: Event, context: None = None, limit: int = {i}) -> list[Pet]:
+    return event.user.pets[:limit]
+"""
+
+MODULE = """
+import os
+
+from pydantic import BaseModel
+from validate_call_safe import validate_call_safe
+
+DEFER = bool(os.environ.get("DEFER"))
+
+
+class Pet(BaseModel):
+    name: str
+    age: int
+
+
+class Person(BaseModel):
+    name: str
+    pets: list[Pet] = []
+
+
+class Event(BaseModel):
+    user: Person
+"""
+
+TIMER = """
+from time import perf_counter
+import pydantic, validate_call_safe  # Imported ahead, so only the module is timed
+
+start = perf_counter()
+import handlers
+imported = perf_counter()
+if {warmup}:
+    from validate_call_safe.deferred import warmup
+    warmup(parallel={parallel})
+else:
+    handlers.handler_0({{"user": {{"name": "A"}}}})
+print(imported - start, perf_counter() - imported)
+"""
+
+
+def cold_start(directory, defer, warmup=False, parallel=False, rounds=5):
+    """The best import time and warmup (or first call) time over several processes."""
+    env = {"DEFER": "1"} if defer else {}
+    code = TIMER.format(warmup=warmup, parallel=parallel)
+    times = []
+    for _ in range(rounds):
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=directory,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        times.append(tuple(map(float, out.split())))
+    return min(t[0] for t in times), min(t[1] for t in times)
+
+
+def run_benchmarks(num_handlers=(100, 500)):
+    print(f"{'Mode':<45} {'Import (ms)':<15} {'Then (ms)':<15}")
+    print("-" * 75)
+    for n in num_handlers:
+        with tempfile.TemporaryDirectory() as directory:
+            source = MODULE + "".join(HANDLER.format(i=i) for i in range(n))
+            Path(directory, "handlers.py").write_text(source)
+            for name, kwargs in [
+                ("eager (first call)", {"defer": False}),
+                ("defer (first call)", {"defer": True}),
+                ("defer (warmup)", {"defer": True, "warmup": True}),
+                (
+                    "defer (parallel warmup)",
+                    {"defer": True, "warmup": True, "parallel": True},
+                ),
+            ]:
+                imported, then = cold_start(directory, **kwargs)
+                print(
+                    f"{f'{n} handlers, {name}':<45} {imported * 1e3:<15.1f} {then * 1e3:<15.1f}"
+                )
+
+
+if __name__ == "__main__":
+    run_benchmarks()
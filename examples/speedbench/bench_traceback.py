@@ -0,0 +1,48 @@
+"""Error-path throughput with each traceback policy, for an error raised a few frames deep.
+
+Rendering the full traceback looks up the source line of every frame, which is the
+largest share of the cost of capturing an error in the default `ErrorModel`.
+"""
+
+import timeit
+from functools import partial
+
+from validate_call_safe import validate_call_safe, ErrorModel, LazyErrorModel
+from validate_call_safe.errors.tracebacks import TracebackPolicy
+
+
+def parse(record: dict, depth: int = 5) -> int:
+    if depth:
+        return parse(record, depth - 1)
+    return int(record["value"])
+
+
+policies = {
+    "full": "full",
+    "limited": "limited",
+    "lazy": "lazy",
+    "none": "none",
+    "full_sampled_1_in_10": TracebackPolicy("full", sample=10),
+}
+services = {
+    name: validate_call_safe(
+        LazyErrorModel if policy == "lazy" else ErrorModel,
+        validate_body=True,
+        traceback=policy,
+    )(parse)
+    for name, policy in policies.items()
+}
+invalid_record = {"value": "not an int"}
+
+
+def run_benchmarks(num_iterations=2000, rounds=5):
+    print(f"{'Traceback policy':<35} {'Invalid calls/s':<15}")
+    print("-" * 50)
+    for name, service in services.items():
+        call = partial(service, invalid_record)
+        elapsed = min(timeit.repeat(call, number=num_iterations, repeat=rounds))
+        print(f"{name:<35} {num_iterations / elapsed:<15.0f}")
+
+
+if __name__ == "__main__":
+    run_benchmarks()
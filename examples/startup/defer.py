@@ -0,0 +1,38 @@
+from pydantic import BaseModel
+from validate_call_safe import validate_call_safe, ErrorModel
+from validate_call_safe.deferred import pending, warmup
+
+
+class Event(BaseModel):
+    user: str
+
+
+# Nothing is built when decorated: each handler builds its validators on its first call
+@validate_call_safe(defer=True)
+def greet(event: Event, context: None = None) -> str:
+    return f"Hello {event.user}"
+
+
+@validate_call_safe(defer=True)
+def farewell(event: Event, context: None = None) -> str:
+    return f"Goodbye {event.user}"
+
+
+@validate_call_safe(defer=True)
+def shout(event: Event, context: None = None) -> str:
+    return event.user.upper()
+
+
+waiting = pending()
+assert waiting >= 3
+
+assert greet({"user": "A"}) == "Hello A"
+assert isinstance(greet({}), ErrorModel)
+assert pending() == waiting - 1
+
+# Warm up the given functions (those already built are skipped), or every pending one
+assert warmup([greet, farewell]) == 1
+warmup()
+assert pending() == 0
+assert farewell({"user": "B"}) == "Goodbye B"
+assert shout({"user": "c"}) == "C"
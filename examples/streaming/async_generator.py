@@ -0,0 +1,81 @@
+import asyncio
+import json
+from collections.abc import AsyncIterator
+
+from pydantic import BaseModel
+from validate_call_safe import validate_call_safe, ErrorModel
+
+
+class Record(BaseModel):
+    id: int
+    name: str
+
+
+pulled = []
+closed = []
+
+
+@validate_call_safe(validate_return=True, validate_body=True)
+async def consume(lines: list[str]) -> AsyncIterator[Record]:
+    try:
+        for line in lines:
+            await asyncio.sleep(0)
+            pulled.append(line)
+            yield json.loads(line)
+    finally:
+        closed.append(True)
+
+
+lines = [
+    '{"id": 1, "name": "a"}',
+    '{"id": "x", "name": "b"}',  # Invalid record
+    '{"id": 3, "name": "c"}',
+    "{oops",  # Malformed JSON, raised in the body
+    '{"id": 5, "name": "e"}',
+]
+
+
+async def main():
+    records = [r async for r in consume(lines)]
+    assert [type(r) for r in records] == [Record, ErrorModel, Record, ErrorModel]
+    assert records[1].error_details[0]["loc"] == ("id",)
+    assert records[3].error_type == "JSONDecodeError"
+
+    # A signature error is the only item in the stream
+    bad_call = [r async for r in consume(lines="not a list")]
+    assert len(bad_call) == 1
+    assert isinstance(bad_call[0], ErrorModel)
+
+    # Nothing is pulled ahead of the consumer (backpressure), and closing the
+    # stream closes the underlying async generator
+    pulled.clear()
+    closed.clear()
+    stream = consume(lines)
+    assert await stream.__anext__() == Record(id=1, name="a")
+    assert pulled == lines[:1]
+    await stream.aclose()
+    assert closed == [True]
+
+    # Cancelling a consumer propagates, rather than becoming an error model
+    @validate_call_safe(validate_body=True, extra_exceptions=BaseException)
+    async def stall() -> AsyncIterator[int]:
+        yield 1
+        await asyncio.sleep(10)
+        yield 2
+
+    async def consume_stall():
+        return [i async for i in stall()]
+
+    task = asyncio.create_task(consume_stall())
+    await asyncio.sleep(0.01)
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        cancelled = True
+    else:
+        cancelled = False
+    assert cancelled
+
+
+asyncio.run(main())
@@ -0,0 +1,63 @@
+import json
+from collections.abc import Iterator
+
+from pydantic import BaseModel
+from validate_call_safe import validate_call_safe, ErrorModel
+
+
+class Record(BaseModel):
+    id: int
+    name: str
+
+
+lines = [
+    '{"id": 1, "name": "a"}',
+    '{"id": "x", "name": "b"}',  # Invalid record
+    '{"id": 3, "name": "c"}',
+    "{oops",  # Malformed JSON, raised in the body
+    '{"id": 5, "name": "e"}',
+]
+
+
+@validate_call_safe(validate_return=True, validate_body=True)
+def parse(lines: list[str]) -> Iterator[Record]:
+    for line in lines:
+        yield json.loads(line)
+
+
+# The invalid record is replaced by an error model, and the stream carries on
+# until the body raises, which ends the generator (with a final error model)
+records = list(parse(lines))
+assert [type(r) for r in records] == [Record, ErrorModel, Record, ErrorModel]
+assert records[1].error_type == "ValidationError"
+assert records[1].error_details[0]["loc"] == ("id",)
+assert records[3].error_type == "JSONDecodeError"
+
+# A signature error is caught on calling, and is then the only item in the stream
+bad_call = list(parse(lines="not a list"))
+assert len(bad_call) == 1
+assert isinstance(bad_call[0], ErrorModel)
+
+
+@validate_call_safe(validate_return=True, stop_on_error=True)
+def parse_strict(lines: list[str]) -> Iterator[Record]:
+    for line in lines:
+        yield json.loads(line)
+
+
+strict_records = list(parse_strict(lines))
+assert [type(r) for r in strict_records] == [Record, ErrorModel]
+
+
+# Items are validated lazily, one at a time, so the stream can be unbounded
+@validate_call_safe(validate_return=True)
+def count(start: int) -> Iterator[int]:
+    n = start
+    while True:
+        yield str(n)
+        n += 1
+
+
+counter = count("10")
+assert [next(counter) for _ in range(3)] == [10, 11, 12]
+counter.close()
@@ -0,0 +1,81 @@
+from traceback import TracebackException
+
+from pydantic import BaseModel
+
+from validate_call_safe import validate_call_safe, ErrorModel, LazyErrorModel
+from validate_call_safe.errors.tracebacks import TracebackPolicy
+
+
+def parse(a: str) -> int:
+    return int(a)
+
+
+def full_parse(a: str) -> int:
+    return parse(a)
+
+
+# The full traceback, with source lines (the default)
+full = validate_call_safe(validate_body=True)(full_parse)("A")
+assert "return int(a)" in full.error_tb
+assert full.error_tb.endswith(
+    "ValueError: invalid literal for int() with base 10: 'A'\n"
+)
+
+
+def limited_parse(a: str) -> int:
+    return parse(a)
+
+
+# Only the innermost frames, without their source lines
+limited = validate_call_safe(validate_body=True, traceback="limited")(limited_parse)(
+    "A"
+)
+assert limited.error_tb.startswith("Traceback (most recent call last):\n")
+assert "return int(a)" not in limited.error_tb
+assert "in parse\n" in limited.error_tb
+one_frame = TracebackPolicy("limited", limit=1)
+limited = validate_call_safe(validate_body=True, traceback=one_frame)(limited_parse)(
+    "A"
+)
+assert limited.error_tb.count('  File "') == 1
+
+# No traceback at all
+untraced = validate_call_safe(validate_body=True, traceback="none")(parse)("A")
+assert isinstance(untraced, ErrorModel)
+assert untraced.error_tb == ""
+
+
+def lazy_parse(a: str) -> int:
+    return parse(a)
+
+
+# Rendered on first access, so errors whose traceback is never read cost less
+lazy_safe = validate_call_safe(LazyErrorModel, validate_body=True, traceback="lazy")
+lazy = lazy_safe(lazy_parse)("A")
+assert isinstance(lazy, LazyErrorModel)
+assert isinstance(lazy.error_traceback, TracebackException)
+assert "error_tb" not in lazy.__dict__  # Not rendered yet
+assert "in parse\n" in lazy.error_tb
+assert lazy.model_dump()["error_tb"] == lazy.error_tb
+assert "error_traceback" not in lazy.model_dump()
+
+# Only 1 in every 3 errors gets a traceback
+sampled_parse = validate_call_safe(
+    validate_body=True, traceback=TracebackPolicy("full", sample=3)
+)(parse)
+tracebacks = [sampled_parse("A").error_tb for _ in range(6)]
+assert [bool(tb) for tb in tracebacks] == [True, False, False, True, False, False]
+
+
+class TracedErrorModel(BaseModel):
+    error_type: str
+    error_tb: str
+
+
+for error_model in [TracedErrorModel, ErrorModel]:
+    try:
+        validate_call_safe(error_model, traceback="lazy")(parse)
+    except TypeError:
+        pass  # The model can only hold a rendered traceback
+    else:
+        raise AssertionError("A lazy traceback needs a `LazyErrorModel`")
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+from typing import Annotated
+
+from pydantic import AfterValidator, BaseModel
+from validate_call_safe import validate_call_safe
+from validate_call_safe.output import JsonOutput
+
+
+class Event(BaseModel):
+    user: Person
+
+
+class Person(BaseModel):
+    name: str
+    "Name of the user."
+    pet: Pet
+    "The user's pet."
+
+
+class Pet(BaseModel):
+    animal: str
+    "Type of animal."
+    age: int
+    "Age of animal in years."
+
+
+# Unlike `simple_service.py`, the return value and error model keep their types: both
+# are serialized by one serializer of `int | ErrorModel`, built when decorating
+@validate_call_safe(
+    validate_body=True,
+    validate_return=True,
+    output=JsonOutput(include={"error_type", "error_details"}),
+)
+def check(event: Event, context: None = None) -> int:
+    """Return the user's pet's age, as the bytes of a JSON response."""
+    return event.user.pet.age
+
+
+pet_turtle = check({"user": {"name": "A", "pet": {"animal": "turtle", "age": 100}}})
+assert pet_turtle == b"100"
+
+no_pet_err = check({"user": {"name": "B"}})
+assert type(no_pet_err) is bytes
+error = json.loads(no_pet_err)
+assert list(error) == ["error_type", "error_details"]
+assert error["error_details"][0]["loc"] == [0, "user", "pet"]
+
+# JSON in, JSON out: the request bytes are validated straight into the arguments
+request = b'{"event": {"user": {"name": "C", "pet": {"animal": "cat", "age": 3}}}}'
+assert check.call_json(request) == b"3"
+assert json.loads(check.call_json(b"{"))["error_type"] == "ValidationError"
+assert check.map([(event,) for event in [{"user": {"name": "B"}}]]) == [no_pet_err]
+
+
+@validate_call_safe(output="json")
+def tags(*tags: str) -> list[str]:
+    return sorted(set(tags))
+
+
+assert tags("b", "a", "b") == b'["a","b"]'
+
+
+@validate_call_safe(output="json")
+async def atags(*tags: str) -> list[str]:
+    return sorted(set(tags))
+
+
+assert asyncio.run(atags("b", "a")) == b'["a","b"]'
+
+
+def positive(n: int) -> int:
+    if n < 1:
+        raise ValueError("must be positive")
+    return n
+
+
+# A validator's `ValueError` is kept in its error's `ctx`, and serialized as its `str`
+@validate_call_safe(output="json")
+def quantity(n: Annotated[int, AfterValidator(positive)]) -> int:
+    return n
+
+
+for negative in [quantity(-1), quantity.call_json(b'{"n": -1}')]:
+    [detail] = json.loads(negative)["error_details"]
+    assert detail["type"] == "value_error"
+    assert detail["ctx"] == {"error": "must be positive"}
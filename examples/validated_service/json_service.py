@@ -0,0 +1,59 @@
+from typing import Literal
+
+from pydantic import BaseModel
+from validate_call_safe import validate_call_safe, ErrorModel
+
+
+class Pet(BaseModel):
+    name: str
+    species: Literal["cat", "dog"]
+    age: int
+
+
+class Person(BaseModel):
+    name: str
+    age: int
+    pets: list[Pet] = []
+
+
+class Event(BaseModel):
+    user: Person
+
+
+@validate_call_safe(validate_body=True, validate_return=True)
+def service(event: Event, context: None = None) -> int:
+    """Return the age of the user's first pet (or an error model)."""
+    return event.user.pets[0].age
+
+
+# The arguments are validated straight from the request bytes: a JSON object is the
+# keyword arguments, and a JSON array the positional arguments
+request = b'{"event": {"user": {"name": "A", "age": 1, "pets": [{"name": "Tom", "species": "cat", "age": 3}]}}}'
+assert service.call_json(request) == 3
+assert service.call_json(request.decode()) == 3
+assert service.call_json(
+    b'[{"user": {"name": "A", "age": 1, "pets": []}}]'
+).error_type == ("IndexError")
+
+invalid = service.call_json(b'{"event": {"user": {"name": "A", "age": "one"}}}')
+assert isinstance(invalid, ErrorModel)
+assert invalid.error_details[0]["loc"] == ("event", "user", "age")
+
+# Malformed JSON is captured like any other invalid input, never raised
+malformed = service.call_json(b'{"event": {"user"')
+assert isinstance(malformed, ErrorModel)
+assert malformed.error_type == "ValidationError"
+assert malformed.error_details[0]["type"] == "json_invalid"
+
+
+def make_handler():
+    # Nested functions are titled by their qualified name in validation errors
+    @validate_call_safe
+    def handler(count: int) -> int:
+        return count
+
+    return handler
+
+
+assert isinstance(make_handler().call_json(b'{"count": "many"}'), ErrorModel)
+assert isinstance(make_handler()("many"), ErrorModel)
@@ -1,4 +1,4 @@
-from .errors import ErrorDetails
+from .errors import ErrorDetails, LazyErrorModel
 from .decorator import validate_call_safe, ErrorModel
 
-__all__ = ("ErrorDetails", "validate_call_safe", "ErrorModel")
+__all__ = ("ErrorDetails", "validate_call_safe", "ErrorModel", "LazyErrorModel")
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any
+
+from pydantic import TypeAdapter
+
+__all__ = (
+    "ADAPTER_CACHE_MAXSIZE",
+    "get_type_adapter",
+    "adapter_cache_info",
+    "adapter_cache_clear",
+)
+
+ADAPTER_CACHE_MAXSIZE = 128
+"""Bound on the number of distinct error model types with a cached `TypeAdapter`."""
+
+
+@lru_cache(maxsize=ADAPTER_CACHE_MAXSIZE)
+def _cached_type_adapter(tp: Any) -> TypeAdapter:
+    return TypeAdapter(tp)
+
+
+def get_type_adapter(tp: Any) -> TypeAdapter:
+    """Get a `TypeAdapter` for a type, shared process-wide via a bounded LRU cache.
+
+    Building a `TypeAdapter` builds a pydantic-core schema, which is far slower than
+    validating with it, so decorators sharing an error model share the one adapter.
+    Unhashable types (e.g. `Annotated` with unhashable metadata) are built uncached.
+    """
+    try:
+        hash(tp)
+    except TypeError:
+        return TypeAdapter(tp)
+    return _cached_type_adapter(tp)
+
+
+def adapter_cache_info():
+    """Hit/miss statistics of the shared `TypeAdapter` cache (a `functools` `CacheInfo`)."""
+    return _cached_type_adapter.cache_info()
+
+
+def adapter_cache_clear() -> None:
+    """Empty the shared `TypeAdapter` cache and reset its statistics."""
+    _cached_type_adapter.cache_clear()
@@ -0,0 +1,323 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import partial, wraps
+from threading import Lock
+from time import monotonic
+from typing import Any, NamedTuple
+
+__all__ = (
+    "CachePolicy",
+    "CacheInfo",
+    "ResultCache",
+    "cache_policy",
+    "arguments_key",
+    "raw_key",
+    "memoized",
+    "arguments_marked",
+    "error_memoized",
+    "coalesced",
+)
+
+MISSING = object()
+"""Sentinel returned by `ResultCache.get` for a key with no (live) entry."""
+
+# Whether the body of the call in progress (to a function memoizing its error models)
+# was reached, i.e. its arguments were valid. Context variables are per thread and per
+# asyncio task, so concurrent calls don't mix.
+_arguments_valid: ContextVar[bool] = ContextVar("arguments_valid", default=False)
+
+
+@dataclass(frozen=True, slots=True)
+class CachePolicy:
+    """How many results to memoize, and for how long.
+
+    Error models are only memoized if given a policy of their own as `errors`: they are
+    keyed on the arguments as passed (they may not be valid, so can't be normalised).
+    """
+
+    maxsize: int | None = 128
+    "Number of entries to keep, evicting the least recently used (`None` for no bound)."
+    ttl: float | None = None
+    "Seconds an entry is kept for after being stored (`None` to keep until evicted)."
+    errors: CachePolicy | None = None
+    "The policy for error models, which are not memoized if `None`."
+
+
+def cache_policy(cache: bool | int | CachePolicy) -> CachePolicy | None:
+    """The policy for a decorator's `cache` argument: `True` for the default policy,
+    or an `int` for the default policy with that `maxsize`."""
+    if cache is True:
+        return CachePolicy()
+    elif cache is False or cache is None:
+        return None
+    elif isinstance(cache, int):
+        return CachePolicy(maxsize=cache)
+    elif isinstance(cache, CachePolicy):
+        return cache
+    raise TypeError(f"cache must be a bool, int or CachePolicy, not {cache!r}")
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a `ResultCache` (like a `functools` `CacheInfo`)."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int | None
+    currsize: int
+
+
+class ResultCache:
+    """A thread-safe LRU cache, whose entries optionally expire after a TTL.
+
+    Entries evicted for being the least recently used, or found to have expired when
+    looked up, are both counted as evictions.
+    """
+
+    __slots__ = ("maxsize", "ttl", "hits", "misses", "evictions", "_entries", "_lock")
+
+    def __init__(self, policy: CachePolicy) -> None:
+        self.maxsize = policy.maxsize
+        self.ttl = policy.ttl
+        self._entries: OrderedDict[Hashable, tuple[Any, float | None]] = OrderedDict()
+        self._lock = Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    def get(self, key: Hashable) -> Any:
+        """The value stored for `key`, or `MISSING` (raises `TypeError` if unhashable)."""
+        with self._lock:
+            entry = self._entries.get(key, MISSING)
+            if entry is not MISSING:
+                value, expires = entry
+                if expires is None or monotonic() < expires:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+                self.evictions += 1
+            self.misses += 1
+            return MISSING
+
+    def set(self, key: Hashable, value: Any) -> None:
+        expires = None if self.ttl is None else monotonic() + self.ttl
+        with self._lock:
+            self._entries[key] = (value, expires)
+            self._entries.move_to_end(key)
+            if self.maxsize is not None and len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove every entry and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(
+            self.hits, self.misses, self.evictions, self.maxsize, len(self._entries)
+        )
+
+
+POSITIONAL_KINDS = (
+    inspect.Parameter.POSITIONAL_ONLY,
+    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+)
+
+
+def arguments_key(func: Callable) -> Callable[[tuple, dict], Hashable]:
+    """Make a function giving the cache key of (validated) arguments to `func`.
+
+    Arguments are bound to the signature with defaults applied, so that a call passing
+    an argument by keyword, by position, or leaving it as its default share a key. When
+    every parameter is positional and every argument passed by position, the `args`
+    tuple is already that key and no binding is needed.
+    """
+    signature = inspect.signature(func)
+    n_params = len(signature.parameters)
+    all_positional = all(
+        param.kind in POSITIONAL_KINDS for param in signature.parameters.values()
+    )
+
+    def key(args: tuple, kwargs: dict) -> Hashable:
+        if all_positional:
+            if not kwargs and len(args) == n_params:
+                return args
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return bound.args
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        return bound.args, tuple(sorted(bound.kwargs.items()))
+
+    return key
+
+
+def raw_key(args: tuple, kwargs: dict) -> Hashable:
+    """The cache key of arguments as passed (before validation).
+
+    Each argument's type is part of the key (as for `lru_cache(typed=True)`), since
+    arguments that are equal but of different types (such as `True` and `1`) may not
+    validate alike, e.g. in strict mode.
+    """
+    arg_types = tuple(type(arg) for arg in args)
+    if kwargs:
+        items = tuple(sorted(kwargs.items()))
+        return args, items, arg_types, tuple(type(value) for _, value in items)
+    return args, arg_types
+
+
+def memoized(
+    func: Callable,
+    cache: ResultCache,
+    key: Callable[[tuple, dict], Hashable],
+) -> Callable:
+    """Wrap a function body to look up its result in `cache` before running it.
+
+    This is called by `validate_call` with the validated arguments, so is keyed on them.
+    Only return values are stored (errors raised by the body propagate as usual), and
+    calls with unhashable arguments are run without the cache.
+    """
+    if inspect.iscoroutinefunction(func):
+
+        @wraps(func)
+        async def memoized_func(*args: Any, **kwargs: Any) -> Any:
+            k = key(args, kwargs)
+            try:
+                ret = cache.get(k)
+            except TypeError:
+                return await func(*args, **kwargs)  # Unhashable arguments
+            if ret is MISSING:
+                ret = await func(*args, **kwargs)
+                cache.set(k, ret)
+            return ret
+
+    else:
+
+        @wraps(func)
+        def memoized_func(*args: Any, **kwargs: Any) -> Any:
+            k = key(args, kwargs)
+            try:
+                ret = cache.get(k)
+            except TypeError:
+                return func(*args, **kwargs)  # Unhashable arguments
+            if ret is MISSING:
+                ret = func(*args, **kwargs)
+                cache.set(k, ret)
+            return ret
+
+    return memoized_func
+
+
+def arguments_marked(func: Callable) -> Callable:
+    """Wrap a function body to mark the call in progress as having valid arguments, for
+    `error_memoized` to tell errors in validating them from errors after (in the body or
+    its return value), which may not recur."""
+    if inspect.iscoroutinefunction(func):
+
+        @wraps(func)
+        async def marked_func(*args: Any, **kwargs: Any) -> Any:
+            _arguments_valid.set(True)
+            return await func(*args, **kwargs)
+
+    else:
+
+        @wraps(func)
+        def marked_func(*args: Any, **kwargs: Any) -> Any:
+            _arguments_valid.set(True)
+            return func(*args, **kwargs)
+
+    return marked_func
+
+
+def error_memoized(
+    wrapper: Callable,
+    cache: ResultCache,
+    is_error: Callable[[Any], bool],
+) -> Callable:
+    """Wrap a decorated function to return the error model it last returned for the
+    same arguments (as passed), rather than validating them and capturing the error
+    again.
+
+    Only results for which `is_error` is true, of calls whose body was not reached (so
+    whose arguments were invalid), are stored: the body must be wrapped by
+    `arguments_marked`. An error raised by the body (such as a dropped connection) or
+    by validating its return value is not pinned for the next call.
+    """
+    if inspect.iscoroutinefunction(wrapper):
+
+        @wraps(wrapper)
+        async def error_memoized_wrapper(*args: Any, **kwargs: Any) -> Any:
+            k = raw_key(args, kwargs)
+            try:
+                ret = cache.get(k)
+            except TypeError:
+                return await wrapper(*args, **kwargs)  # Unhashable arguments
+            if ret is MISSING:
+                token = _arguments_valid.set(False)
+                try:
+                    ret = await wrapper(*args, **kwargs)
+                    arguments_valid = _arguments_valid.get()
+                finally:
+                    _arguments_valid.reset(token)  # For a call this one is within
+                if not arguments_valid and is_error(ret):
+                    cache.set(k, ret)
+            return ret
+
+    else:
+
+        @wraps(wrapper)
+        def error_memoized_wrapper(*args: Any, **kwargs: Any) -> Any:
+            k = raw_key(args, kwargs)
+            try:
+                ret = cache.get(k)
+            except TypeError:
+                return wrapper(*args, **kwargs)  # Unhashable arguments
+            if ret is MISSING:
+                token = _arguments_valid.set(False)
+                try:
+                    ret = wrapper(*args, **kwargs)
+                    arguments_valid = _arguments_valid.get()
+                finally:
+                    _arguments_valid.reset(token)  # For a call this one is within
+                if not arguments_valid and is_error(ret):
+                    cache.set(k, ret)
+            return ret
+
+    return error_memoized_wrapper
+
+
+def coalesced(func: Callable, key: Callable[[tuple, dict], Hashable]) -> Callable:
+    """Wrap a coroutine function body so that concurrent calls with the same (validated)
+    arguments share one execution of it, in a task that all of the callers await.
+
+    The task is shielded, so a caller being cancelled doesn't cancel it for the others.
+    It is forgotten once done, so later calls run the body again (unless memoized).
+    """
+    in_flight: dict[Hashable, asyncio.Task] = {}
+
+    def forget(k: Hashable, task: asyncio.Task) -> None:
+        del in_flight[k]
+        if not task.cancelled():
+            task.exception()  # Retrieved, even if every caller was cancelled
+
+    @wraps(func)
+    async def coalesced_func(*args: Any, **kwargs: Any) -> Any:
+        # Tasks belong to an event loop, so calls are only shared within one loop
+        k = (asyncio.get_running_loop(), key(args, kwargs))
+        try:
+            task = in_flight.get(k)
+        except TypeError:
+            return await func(*args, **kwargs)  # Unhashable arguments
+        if task is None:
+            task = in_flight[k] = asyncio.ensure_future(func(*args, **kwargs))
+            task.add_done_callback(partial(forget, k))
+        return await asyncio.shield(task)
+
+    return coalesced_func
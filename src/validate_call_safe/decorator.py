@@ -1,11 +1,17 @@
 from __future__ import annotations
 
-from functools import wraps
-from traceback import format_exc
+import asyncio
+import dataclasses
+from functools import lru_cache, partial, wraps
+import inspect
+from threading import Lock
+from time import perf_counter
 import types
+import warnings
 from typing import (
     Annotated,
     Any,
+    Literal,
     TypeVar,
     overload,
     get_origin,
@@ -13,11 +19,73 @@ from typing import (
     Union,
     _GenericAlias,
 )
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
 
-from pydantic import BaseModel, ConfigDict, TypeAdapter, ValidationError, validate_call
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    TypeAdapter,
+    ValidationError,
+    validate_call,
+)
+from pydantic_core import ArgsKwargs
 
-from .errors import ErrorModel
+from .adapters import get_type_adapter
+from .caching import (
+    CachePolicy,
+    ResultCache,
+    arguments_key,
+    arguments_marked,
+    cache_policy,
+    coalesced,
+    error_memoized,
+    memoized,
+)
+from . import deferred, engine as engines, sink
+from .errors import ErrorDetails, ErrorModel
+from .errors.construct import trusted_constructor
+from .errors.dispatch import (
+    ErrorCoverageWarning,
+    error_type_dispatch,
+    uncovered_error_types,
+)
+from .errors.fields import error_model_classes, error_model_fields
+from .errors.interning import INTERN_MAXSIZE, ErrorInterner, error_fingerprint
+from .errors.inputs import DetailsPolicy, InputMode, details_getter, details_policy
+from .engine import Engine, core_validate_call, shared_validate_call
+from .errors.tracebacks import (
+    TracebackMode,
+    TracebackPolicy,
+    traceback_policy,
+    traceback_renderer,
+)
+from .metrics import (
+    FunctionStats,
+    end_call,
+    metered,
+    register,
+    start_call,
+    timed_body,
+)
+from .output import JsonOutput, json_serializer, output_policy, serialized
+from .reporting import (
+    CallEvent,
+    MessageReporter,
+    ReportMode,
+    ReportPolicy,
+    StructuredReporter,
+    TailSampledReporter,
+    report_policy,
+)
+from .sampling import sampled, sampler
+from .parallel import ExecutorLike, chunk_rows, executor_for, map_chunk
+from .signature import (
+    arguments_type,
+    as_args_kwargs,
+    return_type,
+    signature_config,
+    yield_type,
+)
 
 T = TypeVar("T", bound=BaseModel)
 R = TypeVar("R")
@@ -42,10 +110,23 @@ def validate_call_safe(
     *,
     config: ConfigDict | None = None,
     validate_return: bool = False,
+    validate_return_rate: float | int = 1,
     validate_body: bool = False,
+    validate_error: bool = True,
     extra_exceptions: type[X] | tuple[type[X]] = Exception,
-    report: bool = False,
-    reporter: Callable[[str], None] = print,
+    report: bool | ReportMode | ReportPolicy = False,
+    reporter: Callable[[str], None] | StructuredReporter = print,
+    stop_on_error: bool = False,
+    metrics: bool = False,
+    cache: bool | int | CachePolicy = False,
+    coalesce: bool = False,
+    traceback: TracebackMode | TracebackPolicy = "full",
+    details: InputMode | DetailsPolicy = "keep",
+    intern: bool | int = False,
+    output: Literal["python", "json"] | JsonOutput = "python",
+    defer: bool = False,
+    engine: Engine | None = None,
+    share: bool = False,
 ) -> Callable[[Callable[..., R]], Callable[..., R | T]]: ...
 
 
@@ -63,10 +144,23 @@ def validate_call_safe(
     *,
     config: ConfigDict | None = None,
     validate_return: bool = False,
+    validate_return_rate: float | int = 1,
     validate_body: bool = False,
+    validate_error: bool = True,
     extra_exceptions: type[X] | tuple[type[X]] = Exception,
-    report: bool = False,
+    report: bool | ReportMode | ReportPolicy = False,
     reporter: Callable = print,
+    stop_on_error: bool = False,
+    metrics: bool = False,
+    cache: bool | int | CachePolicy = False,
+    coalesce: bool = False,
+    traceback: TracebackMode | TracebackPolicy = "full",
+    details: InputMode | DetailsPolicy = "keep",
+    intern: bool | int = False,
+    output: Literal["python", "json"] | JsonOutput = "python",
+    defer: bool = False,
+    engine: Engine | None = None,
+    share: bool = False,
 ):
     """Decorator for validating function calls and handling errors safely.
 
@@ -80,11 +174,56 @@ def validate_call_safe(
         func: The function to be decorated (optional, can be passed in decorator form).
         config: Configuration for the Pydantic model (optional).
         validate_return: Whether to validate the return value.
+        validate_return_rate: The calls whose return value is validated: a fraction of
+                              them sampled at random, or every Nth call. The rest call
+                              a function validating only the arguments.
         validate_body: Whether to handle exceptions besides signature validation.
+        validate_error: Whether to validate the data the error model is built from (if
+                        `False`, a plain model class is constructed without validation,
+                        while models with validators, and `Annotated` and `Union` error
+                        models, are still validated).
         extra_exceptions: Additional exception types to handle in the function body execution
                           (requires `validate_body = True`).
-        report: Whether to report in/outputs via `reporter`.
-        reporter: The function used to report in/outputs if `report = True`.
+        report: Whether to report in/outputs via `reporter`: every call, or only the
+                calls picked once they have finished, by a `ReportPolicy` (`"errors"`
+                for one picking only the calls returning an error model).
+        reporter: The function used to report in/outputs if `report = True`, or a
+                  `StructuredReporter` to be given a `CallEvent` after each call.
+        stop_on_error: Whether a (async) generator function's stream ends after an error
+                       model is yielded in place of an invalid item (a body error always
+                       ends the stream).
+        metrics: Whether to count calls and errors and time them, in the decorated
+                 function's `__vcs_stats__` (also kept in `metrics.registry`).
+        cache: Whether to memoize results, keyed on the validated arguments: `True`
+               (or a `maxsize`) for an LRU cache, or a `CachePolicy` (which can also
+               memoize error models, keyed on the arguments as passed).
+        coalesce: Whether concurrent calls to a coroutine function with the same validated
+                  arguments share one execution of its body (for a short while after,
+                  too, if `cache` has a `ttl`).
+        traceback: How to capture the traceback of an error: `"full"`, `"limited"` (to
+                   the innermost frames, without source lines), `"lazy"` (rendered when
+                   first accessed, which needs a `LazyErrorModel` to be passed as the
+                   error model) or `"none"`, or a
+                   `TracebackPolicy` (which can also sample 1 in N errors' tracebacks).
+        details: What to keep of the invalid input in each of a `ValidationError`'s error
+                 details: `"keep"` it, `"drop"` it, only its `"type"` name, or its repr
+                 `"truncate"`d, or a `DetailsPolicy` (which can also leave out the
+                 URL and context of each error detail).
+        intern: Whether errors of the same shape (fingerprinted by their type, and the
+                type and location of each validation error) return one shared, frozen
+                error model, counting their occurrences: `True` or the number of
+                fingerprints to keep (in the decorated function's `__vcs_interner__`).
+        output: Whether to return results and error models as Python objects, or as
+                `"json"` bytes serialized by one serializer built up front, or by a
+                `JsonOutput` (which can also set the fields to include or exclude).
+        defer: Whether to build the function's validators on its first call rather than
+               when it is decorated (or ahead of time, by `deferred.warmup`).
+        engine: What validates calls: `"validate_call"` (pydantic's decorator) or
+                `"core"` (its pydantic-core validator, called directly), defaulting to
+                `engine.default_engine`. The two behave the same.
+        share: Whether functions with the same signature (and config) share one
+               arguments validator and return validator, built for the first of them
+               (requires the core engine, and so defaults to it).
 
     Returns:
         The decorated function that returns either the original return type or the error model.
@@ -126,7 +265,7 @@ def validate_call_safe(
     empty_brackets = error_model_or_func is ErrorModel
     is_annotated_model_cls = is_annotated_basemodel_subclass(error_model_or_func)
     is_model_cls_union = is_union_basemodel_subclasses(error_model_or_func)
-    # For Union, we'll use the default ErrorModel then dump into a TypeAdapter to decide
+    # For Union, we'll validate the error data with a TypeAdapter to decide the model
     is_wrapped_model_cls = is_annotated_model_cls or is_model_cls_union
     pos_arg_is_cls = isinstance(error_model_or_func, type) or is_wrapped_model_cls
 
@@ -144,92 +283,704 @@ def validate_call_safe(
         func = error_model_or_func
         error_model = ErrorModel
 
-    # TODO: cache these TypeAdapters at module level to avoid recomputation latency
-    # (would affect programs with multiple decorated classes with custom error models?)
-    if is_annotated_model_cls:
+    tb_policy = traceback_policy(traceback)
+
+    # TypeAdapters are shared at module level (see `adapters.py`) so decorators using
+    # the same error model don't each pay for building its pydantic-core schema
+    if is_annotated_model_cls or is_model_cls_union:
         # TypeAdapter triggers functional validators in Annotated metadata if present.
-        # Pre-provision it here (upon # decorator creation, if I understand correctly?)
-        # rather than delaying TypeAdapter creation until the wrapper function is run.
-        error_model_validate = TypeAdapter(error_model).validate_python
-    elif is_model_cls_union:
-        # First parse into the default `ErrorModel`, then use a `TypeAdapter` on the
-        # dumped model output to re-parse as one of the `Union` model classes
-        error_model_validate = ErrorModel.model_validate
+        # Pre-provision it here upon decorator creation rather than delaying
+        # TypeAdapter creation until the wrapper function is run.
+        # For a Union, the TypeAdapter picks which of the model classes to parse into.
+        error_model_validate = get_type_adapter(error_model).validate_python
+        dispatch = error_type_dispatch(error_model) if is_model_cls_union else None
+        if dispatch:
+            # Every member has a `Literal` error type, so the member to validate is picked
+            # by the error type (i.e. the exception class) rather than by trying them all
+            validate_member = {
+                error_type: member.model_validate
+                for error_type, member in dispatch.items()
+            }
+            # An error type no member models fails the union's validation, as before
+            union_validate = error_model_validate
+
+            def error_model_validate(error_data: dict) -> T:
+                validate = validate_member.get(error_data["error_type"], union_validate)
+                return validate(error_data)
+
+            uncovered = uncovered_error_types(
+                set(dispatch), validate_body, extra_exceptions
+            )
+            if uncovered:
+                members = " | ".join(
+                    member.__name__ for member in get_args(error_model)
+                )
+                warnings.warn(
+                    f"Error model union {members} doesn't model all errors: "
+                    f"{', '.join(uncovered)} would raise a ValidationError when captured "
+                    "(add a member with a `str` error_type to model them)",
+                    ErrorCoverageWarning,
+                    stacklevel=2,
+                )
+    elif not validate_error:
+        # The error data is built by the wrapper from what pydantic (or the exception)
+        # has just produced, so can be trusted to construct the model without validation
+        error_model_validate = trusted_constructor(error_model)
     else:
         # There is no `Annotated` metadata (so no potential functional validators),
         # so no need to use `TypeAdapter` just a regular `.model_validate()` method
         error_model_validate = error_model.model_validate
 
+    # Only compute the fields that the error model can hold: tracebacks in particular
+    # are expensive to format, and most custom error models don't keep them
+    error_fields = error_model_fields(error_model)
+    keep_type = "error_type" in error_fields
+    keep_details = "error_details" in error_fields
+    keep_str = "error_str" in error_fields
+    keep_repr = "error_repr" in error_fields
+    keep_tb = "error_tb" in error_fields
+    keep_traceback = "error_traceback" in error_fields  # To render lazily
+    if tb_policy.mode == "lazy" and not keep_traceback:
+        raise TypeError(
+            "traceback='lazy' needs an error model with an `error_traceback` field "
+            "(such as `LazyErrorModel`, passed as the error model)"
+        )
+    render_tb = traceback_renderer(tb_policy) if keep_tb else None
+    render_traceback = (
+        traceback_renderer(tb_policy, lazy=True) if keep_traceback else None
+    )
+    d_policy = details_policy(details)
+    if not validate_error and not is_wrapped_model_cls:
+        # Validation would drop the URL of each error detail (`ErrorDetails` has no
+        # such key), so trusted construction must leave it out too, to build the same
+        d_policy = dataclasses.replace(d_policy, include_url=False)
+    get_details = details_getter(d_policy)
+    if is_model_cls_union and keep_details:
+        # Union members are given details in the form the default `ErrorModel` holds
+        details_validate = get_type_adapter(list[ErrorDetails]).validate_python
+    else:
+        details_validate = None
+
+    def capture(e: BaseException, error_t_name: str, error_details: list) -> T:
+        """Validate the error model from an exception caught in the wrapper."""
+        error_data = {}
+        if keep_type:
+            error_data["error_type"] = error_t_name
+        if keep_details:
+            if details_validate:
+                error_details = details_validate(error_details)
+            error_data["error_details"] = error_details
+        if keep_str:
+            error_data["error_str"] = str(e)
+        if keep_repr:
+            error_data["error_repr"] = repr(e)
+        if keep_tb:
+            error_data["error_tb"] = render_tb(e)
+        if keep_traceback:
+            error_data["error_traceback"] = render_traceback(e)
+        return error_model_validate(error_data)
+
+    engine = engine or ("core" if share else engines.default_engine)
+    if engine not in get_args(Engine):
+        raise ValueError(f"engine must be 'validate_call' or 'core', not {engine!r}")
+    if share and engine != "core":
+        # The validator of `validate_call` calls the function, so is its own
+        raise TypeError("share can only be used with engine='core'")
+    use_core = engine == "core"
+    if sampler(validate_return_rate, "validate_return_rate") and not validate_return:
+        raise TypeError("validate_return_rate can only be used with validate_return")
+    policy = cache_policy(cache)
+    error_classes = error_model_classes(error_model)
+    out_policy = output_policy(output)
+
+    if tail_policy := report_policy(report):
+        # Tail sampling decides what to report from each call's event, after the call
+        if not isinstance(reporter, StructuredReporter):
+            reporter = MessageReporter(reporter)
+        reporter = TailSampledReporter(reporter, tail_policy)
+    # A structured reporter is given an event after each call, instead of messages
+    structured = bool(report) and isinstance(reporter, StructuredReporter)
+    report_messages = bool(report) and not structured
+    report_out = report_messages and validate_return  # Whether returns are reported
+
     def validate(f: Callable[..., R]) -> Callable[..., R | T]:
-        validated_func = validate_call(
-            f,
-            config=config,
-            validate_return=validate_return,
+        is_generator = inspect.isgeneratorfunction(f)
+        is_async_generator = inspect.isasyncgenfunction(f)
+        is_stream = is_generator or is_async_generator
+        stats = register(f) if metrics else None
+        # The body is timed from within the validated function (streams run lazily)
+        key = arguments_key(f) if policy or coalesce else None
+        body = f
+        if coalesce:
+            if not inspect.iscoroutinefunction(f):
+                raise TypeError("coalesce can only be used on a coroutine function")
+            body = coalesced(body, key)
+        body = timed_body(body, stats) if metrics and not is_stream else body
+        if policy:
+            if is_stream:
+                raise TypeError("cache can't be used on a generator function")
+            # Looked up after the arguments are validated, before the body is run
+            result_cache = ResultCache(policy)
+            body = memoized(body, result_cache, key)
+        error_cache = ResultCache(policy.errors) if policy and policy.errors else None
+        if error_cache:
+            # Only errors in validating the arguments are memoized, not the body's
+            body = arguments_marked(body)
+        if out_policy and is_stream:
+            raise TypeError("output='json' can't be used on a generator function")
+        # Each function samples its own calls (every Nth is counted per function)
+        should_validate_return = sampler(validate_return_rate)
+        if should_validate_return and is_stream:
+            raise TypeError(
+                "validate_return_rate can't be used on a generator function"
+            )
+
+        def build_validators() -> tuple[Callable, Callable | None, Callable | None]:
+            """Build the validated function, the item validator of a stream, and the
+            JSON serializer (building their schemas is most of the cost of decorating)."""
+
+            def validated_call(validate_ret: bool) -> Callable:
+                if share:
+                    return shared_validate_call(f, body, config, validate_ret)
+                elif use_core:
+                    return core_validate_call(f, body, config, validate_ret)
+                return validate_call(body, config=config, validate_return=validate_ret)
+
+            # Items yielded by a generator are validated one at a time by the wrapper
+            validated = validated_call(validate_return and not is_stream)
+            if should_validate_return:
+                # Unsampled calls go through a function validating only the arguments,
+                # so they pay nothing for return validation
+                unvalidated_return = validated_call(False)
+                validated = sampled(
+                    validated, unvalidated_return, should_validate_return
+                )
+            if is_stream and validate_return and (item_t := yield_type(f)) is not None:
+                f_config = signature_config(f, config)
+                item_val = TypeAdapter(item_t, config=f_config).validate_python
+            else:
+                item_val = None
+            dump = json_serializer(f, error_classes, out_policy) if out_policy else None
+            return validated, item_val, dump
+
+        if defer:
+            # The wrapper calls a stand-in for the validated function until it is built:
+            # the build then rebinds these names, so later calls go straight through
+            build_lock = Lock()
+
+            def build() -> None:
+                nonlocal validated_func, item_validate, dump_json
+                if validated_func is not build_then_call:
+                    return
+                with build_lock:
+                    if validated_func is build_then_call:
+                        validated, item_validate, dump_json = build_validators()
+                        validated_func = validated
+                deferred.done(build)
+
+            def build_then_call(*args: Any, **kwargs: Any) -> Any:
+                build()
+                return validated_func(*args, **kwargs)
+
+            validated_func, item_validate, dump_json = build_then_call, None, None
+            if out_policy:
+                # `.map` and `.call_json` don't call the validated function, so the
+                # serializer they are given builds the validators too
+
+                def serialize(value: R | T) -> bytes:
+                    build()
+                    return dump_json(value)
+
+            else:
+                serialize = None
+        else:
+            validated_func, item_validate, serialize = build_validators()
+
+        _signature_only = not validate_body  # Alias for internal clarity
+        func_name = f.__name__
+        # Errors are titled after the function by `__name__` (or by `__qualname__` in
+        # more recent pydantic versions) when validating its signature or return value
+        signature_titles = (func_name, f.__qualname__)
+        # Repeats of an error share the error model built for its first occurrence
+        interner = (
+            ErrorInterner(INTERN_MAXSIZE if intern is True else intern)
+            if intern
+            else None
         )
 
-        @wraps(f)
-        def wrapper(*args: Any, **kwargs: Any) -> R | T:
-            _signature_only = not validate_body  # Alias for internal clarity
-            func_name = f.__name__
-            try:
-                if report:
-                    msg = f"{func_name} received *{args}, **{kwargs}"
-                    reporter(msg)
-                ret = validated_func(*args, **kwargs)
-            except ValidationError as e:
-                # Good enough heuristic to tell if the error came from the func schema
-                is_signature_ve = validated_func.__name__ == e.title
-                if _signature_only and not is_signature_ve:
-                    raise
-                else:
-                    error_t_name = "ValidationError"
-                    ret = error_model_validate(
-                        dict(
-                            error_type=error_t_name,
-                            error_details=e.errors(),
-                            error_str=str(e),
-                            error_repr=repr(e),
-                            error_tb=format_exc(),
-                        ),
-                    )
-                    # TODO: move this TypeAdapter construction up to a higher level:
-                    if is_model_cls_union:
-                        # We just validated into a temporary ErrorModel
-                        # Now validate using a TypeAdapter on the Union of models
-                        ret = TypeAdapter(error_model).validate_python(ret.model_dump())
-                    if report and validate_return:
-                        reporter(f"{func_name} -> {ret!r}")
-            except extra_exceptions as e:
-                if _signature_only:
-                    raise
+        # These handlers must be called from within the `except` clause of the
+        # wrapper, so that a bare `raise` re-raises and `format_exc` sees the error
+        def handle_validation_error(e: ValidationError) -> T:
+            # Good enough heuristic to tell if the error came from the func schema
+            # (`validate_call` names its wrapper, and titles its errors, after `f`)
+            if _signature_only and e.title not in signature_titles:
+                raise
+            if interner:
+                fingerprint = error_fingerprint(e)
+                ret = interner.get(fingerprint)
+                if ret is None:
+                    error_details = get_details(e) if keep_details else []
+                    ret = capture(e, "ValidationError", error_details)
+                    ret = interner.add(fingerprint, ret)
+            else:
+                error_details = get_details(e) if keep_details else []
+                ret = capture(e, "ValidationError", error_details)
+            if (error_sink := sink.ring) is not None:
+                error_sink.push(func_name, ret)
+            if stats:
+                if e.title in signature_titles:
+                    stats.record_validation_error()
                 else:
-                    error_t_name = type(e).__name__
-                    ret = error_model_validate(
-                        dict(
-                            error_type=error_t_name,
-                            error_details=[],
-                            error_str=str(e),
-                            error_repr=repr(e),
-                            error_tb=format_exc(),
-                        ),
-                    )
-                    # TODO: move this TypeAdapter construction up to a higher level:
-                    if is_model_cls_union:
-                        # We just validated into a temporary ErrorModel
-                        # Now validate using a TypeAdapter on the Union of models
-                        ret = TypeAdapter(error_model).validate_python(ret.model_dump())
-                    if report and validate_return:
-                        reporter(f"{func_name} -> {ret!r}")
+                    stats.record_body_error("ValidationError")
+            if report_out:
+                reporter(f"{func_name} -> {ret!r}")
+            return ret
+
+        def handle_exception(e: BaseException) -> T:
+            if _signature_only:
+                raise
+            error_t_name = type(e).__name__
+            if interner:
+                fingerprint = error_fingerprint(e)
+                ret = interner.get(fingerprint)
+                if ret is None:
+                    ret = interner.add(fingerprint, capture(e, error_t_name, []))
             else:
-                if report and validate_return:
-                    f_name = f.__name__
-                    ret_t_name = type(ret).__name__
-                    msg = f"{f_name} -> {ret_t_name}: {ret!r}"
-                    reporter(msg)
+                ret = capture(e, error_t_name, [])
+            if (error_sink := sink.ring) is not None:
+                error_sink.push(func_name, ret)
+            if stats:
+                stats.record_body_error(error_t_name)
+            if report_out:
+                reporter(f"{func_name} -> {ret!r}")
             return ret
 
+        def report_return(ret: R) -> None:
+            ret_t_name = type(ret).__name__
+            msg = f"{func_name} -> {ret_t_name}: {ret!r}"
+            reporter(msg)
+
+        def report_event(
+            args: tuple,
+            kwargs: dict,
+            ret: R | T,
+            start: float,
+            outcome: Literal["success", "error"],
+        ) -> None:
+            duration = perf_counter() - start
+            reporter.report(CallEvent(func_name, args, kwargs, ret, duration, outcome))
+
+        # Each wrapper is specialised to the decorator's configuration up front, so the
+        # common case (no reporting) is a bare try/except around the validated function,
+        # and body exceptions are only caught at all when they are to be captured
+        if inspect.iscoroutinefunction(f):
+            # The coroutine is awaited inside the `try`, so errors raised in the body
+            # (and by return validation, which pydantic does after awaiting) are caught
+            if validate_body:
+
+                async def call(*args: Any, **kwargs: Any) -> R | T:
+                    try:
+                        return await validated_func(*args, **kwargs)
+                    except ValidationError as e:
+                        return handle_validation_error(e)
+                    except extra_exceptions as e:
+                        return handle_exception(e)
+
+            else:
+
+                async def call(*args: Any, **kwargs: Any) -> R | T:
+                    try:
+                        return await validated_func(*args, **kwargs)
+                    except ValidationError as e:
+                        return handle_validation_error(e)
+
+            if structured:
+
+                @wraps(f)
+                async def wrapper(*args: Any, **kwargs: Any) -> R | T:
+                    if not reporter.is_enabled():
+                        return await call(*args, **kwargs)
+                    start = perf_counter()
+                    try:
+                        ret = await validated_func(*args, **kwargs)
+                    except ValidationError as e:
+                        ret = handle_validation_error(e)
+                        report_event(args, kwargs, ret, start, "error")
+                    except extra_exceptions as e:
+                        ret = handle_exception(e)
+                        report_event(args, kwargs, ret, start, "error")
+                    else:
+                        report_event(args, kwargs, ret, start, "success")
+                    return ret
+
+            elif report:
+
+                @wraps(f)
+                async def wrapper(*args: Any, **kwargs: Any) -> R | T:
+                    try:
+                        reporter(f"{func_name} received *{args}, **{kwargs}")
+                        ret = await validated_func(*args, **kwargs)
+                    except ValidationError as e:
+                        return handle_validation_error(e)
+                    except extra_exceptions as e:
+                        return handle_exception(e)
+                    if report_out:
+                        report_return(ret)
+                    return ret
+
+            else:
+                wrapper = wraps(f)(call)
+
+        elif is_generator:
+
+            def stream(gen: Iterator) -> Iterator:
+                """Yield the generator's items, in place of which errors are yielded as
+                error models (ending the stream if raised from the generator itself)."""
+                try:
+                    while True:
+                        try:
+                            item = next(gen)
+                        except StopIteration:
+                            return
+                        except ValidationError as e:
+                            yield handle_validation_error(e)
+                            return
+                        except extra_exceptions as e:
+                            yield handle_exception(e)
+                            return
+                        if item_validate:
+                            try:
+                                item = item_validate(item)
+                            except ValidationError as e:
+                                yield handle_validation_error(e)
+                                if stop_on_error:
+                                    return
+                                continue
+                        yield item
+                finally:
+                    gen.close()
+
+            # The arguments are validated when called, and the stream of items is then
+            # validated lazily. A signature error is the only item of the stream, so the
+            # return value can always be iterated (error models are iterable too!)
+            @wraps(f)
+            def wrapper(*args: Any, **kwargs: Any) -> Iterator[R | T]:
+                # A structured reporter is given the creation of the stream as the call
+                reported = structured and reporter.is_enabled()
+                start = perf_counter() if reported else 0.0
+                try:
+                    if report_messages:
+                        reporter(f"{func_name} received *{args}, **{kwargs}")
+                    gen = validated_func(*args, **kwargs)
+                except ValidationError as e:
+                    error = handle_validation_error(e)
+                except extra_exceptions as e:
+                    error = handle_exception(e)
+                else:
+                    ret = stream(gen)
+                    if reported:
+                        report_event(args, kwargs, ret, start, "success")
+                    return ret
+                if reported:
+                    report_event(args, kwargs, error, start, "error")
+                return iter([error])
+
+        elif is_async_generator:
+
+            async def astream(agen: AsyncIterator) -> AsyncIterator:
+                """Yield the async generator's items, in place of which errors are yielded
+                as error models (ending the stream if raised from the generator itself).
+
+                Items are pulled one at a time as the consumer asks for them (nothing is
+                buffered) and closing this stream closes the async generator."""
+                try:
+                    while True:
+                        try:
+                            item = await agen.__anext__()
+                        except StopAsyncIteration:
+                            return
+                        except asyncio.CancelledError:
+                            raise  # Never capture cancellation as an error model
+                        except ValidationError as e:
+                            yield handle_validation_error(e)
+                            return
+                        except extra_exceptions as e:
+                            yield handle_exception(e)
+                            return
+                        if item_validate:
+                            try:
+                                item = item_validate(item)
+                            except ValidationError as e:
+                                yield handle_validation_error(e)
+                                if stop_on_error:
+                                    return
+                                continue
+                        yield item
+                finally:
+                    await agen.aclose()
+
+            async def aiter_error(error: T) -> AsyncIterator[T]:
+                yield error
+
+            @wraps(f)
+            def wrapper(*args: Any, **kwargs: Any) -> AsyncIterator[R | T]:
+                # A structured reporter is given the creation of the stream as the call
+                reported = structured and reporter.is_enabled()
+                start = perf_counter() if reported else 0.0
+                try:
+                    if report_messages:
+                        reporter(f"{func_name} received *{args}, **{kwargs}")
+                    agen = validated_func(*args, **kwargs)
+                except ValidationError as e:
+                    error = handle_validation_error(e)
+                except extra_exceptions as e:
+                    error = handle_exception(e)
+                else:
+                    ret = astream(agen)
+                    if reported:
+                        report_event(args, kwargs, ret, start, "success")
+                    return ret
+                if reported:
+                    report_event(args, kwargs, error, start, "error")
+                return aiter_error(error)
+
+        else:
+            if validate_body:
+
+                def call(*args: Any, **kwargs: Any) -> R | T:
+                    try:
+                        return validated_func(*args, **kwargs)
+                    except ValidationError as e:
+                        return handle_validation_error(e)
+                    except extra_exceptions as e:
+                        return handle_exception(e)
+
+            else:
+
+                def call(*args: Any, **kwargs: Any) -> R | T:
+                    try:
+                        return validated_func(*args, **kwargs)
+                    except ValidationError as e:
+                        return handle_validation_error(e)
+
+            if structured:
+
+                @wraps(f)
+                def wrapper(*args: Any, **kwargs: Any) -> R | T:
+                    if not reporter.is_enabled():
+                        return call(*args, **kwargs)
+                    start = perf_counter()
+                    try:
+                        ret = validated_func(*args, **kwargs)
+                    except ValidationError as e:
+                        ret = handle_validation_error(e)
+                        report_event(args, kwargs, ret, start, "error")
+                    except extra_exceptions as e:
+                        ret = handle_exception(e)
+                        report_event(args, kwargs, ret, start, "error")
+                    else:
+                        report_event(args, kwargs, ret, start, "success")
+                    return ret
+
+            elif report:
+
+                @wraps(f)
+                def wrapper(*args: Any, **kwargs: Any) -> R | T:
+                    try:
+                        reporter(f"{func_name} received *{args}, **{kwargs}")
+                        ret = validated_func(*args, **kwargs)
+                    except ValidationError as e:
+                        return handle_validation_error(e)
+                    except extra_exceptions as e:
+                        return handle_exception(e)
+                    if report_out:
+                        report_return(ret)
+                    return ret
+
+            else:
+                wrapper = wraps(f)(call)
+
+        if stats:
+            wrapper = metered(wrapper, stats)
+            wrapper.__vcs_stats__ = stats
+        if interner:
+            wrapper.__vcs_interner__ = interner
+        if error_cache:
+            # Repeated invalid arguments return the same error model without revalidating
+            wrapper = error_memoized(
+                wrapper, error_cache, lambda ret: isinstance(ret, error_classes)
+            )
+            wrapper.error_cache_info = error_cache.info
+        if policy:
+            wrapper.cache_info = result_cache.info
+
+            def cache_clear() -> None:
+                result_cache.clear()
+                if error_cache:
+                    error_cache.clear()
+
+            wrapper.cache_clear = cache_clear
+        if serialize:
+            # Results and error models are serialized by serializers built once
+            wrapper = serialized(wrapper, serialize)
+        if not (inspect.iscoroutinefunction(f) or is_stream):
+            wrapper.map, wrapper.call_json = make_validated_calls(
+                wrapper,
+                f,
+                body,
+                stats,
+                handle_validation_error,
+                handle_exception,
+                serialize,
+                should_validate_return,
+            )
+        if defer:
+            wrapper.__vcs_build__ = build
+            deferred.register(build)
         return wrapper
 
+    def make_validated_calls(
+        wrapper: Callable[..., R | T],
+        f: Callable[..., R],
+        body: Callable[..., R],
+        stats: FunctionStats | None,
+        handle_validation_error: Callable[[ValidationError], T],
+        handle_exception: Callable[[BaseException], T],
+        serialize: Callable[[R | T], bytes] | None,
+        should_validate_return: Callable[[], bool] | None,
+    ) -> tuple[
+        Callable[[Iterable[tuple | dict | ArgsKwargs]], list[R | T]],
+        Callable[[str | bytes | bytearray], R | T],
+    ]:
+        """Make the `.map` and `.call_json` methods, which validate arguments with the
+        function's arguments schema on its own, then call the function body directly
+        (serializing each result with `serialize` if given, as the wrapper does)."""
+        func_name = f.__name__
+
+        @lru_cache(maxsize=None)
+        def adapters() -> tuple[TypeAdapter, TypeAdapter, TypeAdapter | None]:
+            # Built on first use, as most decorated functions are never called this way
+            f_config = signature_config(f, config)
+            args_t = arguments_type(f)
+            batch_adapter = TypeAdapter(list[args_t], config=f_config)
+            row_adapter = TypeAdapter(args_t, config=f_config)
+            if validate_return:
+                return_adapter = TypeAdapter(return_type(f), config=f_config)
+            else:
+                return_adapter = None
+            return batch_adapter, row_adapter, return_adapter
+
+        def call_validated(
+            args_in: tuple,
+            kwargs_in: dict | None,
+            validated_row: tuple[tuple, dict] | None,
+            validate_row: Callable[[], tuple[tuple, dict]],
+            reported: bool,
+        ) -> R | T:
+            """Call the function body with validated arguments (or else validated by
+            `validate_row`, to raise its own `ValidationError`) as the wrapper would."""
+            return_adapter = adapters()[2]
+            kwargs_in = kwargs_in or {}  # As a call passing no kwargs has them
+            start = perf_counter() if reported or stats else 0.0
+            if stats:
+                token = start_call()
+            outcome = "error"
+            try:
+                try:
+                    if report_messages:
+                        reporter(f"{func_name} received *{args_in}, **{kwargs_in}")
+                    if validated_row is None:
+                        validated_row = validate_row()
+                    args, kwargs = validated_row
+                    ret = body(*args, **kwargs)
+                    if return_adapter and (
+                        should_validate_return is None or should_validate_return()
+                    ):
+                        ret = return_adapter.validate_python(ret)
+                except ValidationError as e:
+                    ret = handle_validation_error(e)
+                except extra_exceptions as e:
+                    ret = handle_exception(e)
+                else:
+                    outcome = "success"
+                    if report_out:
+                        reporter(f"{func_name} -> {type(ret).__name__}: {ret!r}")
+            except BaseException:
+                # An uncaptured error (raised by a handler) ends a batch
+                if stats:
+                    stats.raised += 1
+                    end_call(stats, token, start)
+                raise
+            if stats:
+                end_call(stats, token, start)
+            if reported:
+                duration = perf_counter() - start
+                event = CallEvent(func_name, args_in, kwargs_in, ret, duration, outcome)
+                reporter.report(event)
+            return serialize(ret) if serialize else ret
+
+        def map_rows(
+            rows: Iterable[tuple | dict | ArgsKwargs],
+            executor: ExecutorLike | None = None,
+            chunksize: int | None = None,
+        ) -> list[R | T]:
+            """Call the function on each row of arguments (a tuple of args, a dict of
+            kwargs, or `ArgsKwargs`), validating all the rows' arguments in one pass.
+
+            Returns a list in the order of the rows, each element being either the return
+            value or the error model (exactly as a call to the decorated function gives,
+            so serialized to JSON with `output="json"`).
+
+            If an `executor` is given (or "thread"/"process" to use a new pool of that
+            kind) the rows are split into chunks of `chunksize`, each mapped by a worker.
+            A process pool requires the decorated function to be importable by workers,
+            and its arguments, return values and error models to be picklable.
+            """
+            rows = [as_args_kwargs(row) for row in rows]
+            if executor is not None:
+                chunks = chunk_rows(rows, chunksize)
+                with executor_for(executor) as pool:
+                    mapped = pool.map(partial(map_chunk, wrapper), chunks)
+                    return [ret for chunk_results in mapped for ret in chunk_results]
+            batch_adapter, row_adapter, _ = adapters()
+            try:
+                validated = batch_adapter.validate_python(rows)
+            except ValidationError as e:
+                # The rows' errors are located by their index: validate the rest again
+                invalid = {err["loc"][0] for err in e.errors(include_url=False)}
+                valid_idx = [i for i in range(len(rows)) if i not in invalid]
+                validated = [None] * len(rows)
+                valid_rows = batch_adapter.validate_python([rows[i] for i in valid_idx])
+                for i, valid_row in zip(valid_idx, valid_rows):
+                    validated[i] = valid_row
+            reported = structured and reporter.is_enabled()
+            return [
+                # An invalid row is validated alone to raise its own ValidationError
+                call_validated(
+                    row.args,
+                    row.kwargs,
+                    validated_row,
+                    partial(row_adapter.validate_python, row),
+                    reported,
+                )
+                for row, validated_row in zip(rows, validated)
+            ]
+
+        def call_json(raw: str | bytes | bytearray) -> R | T:
+            """Call the function with arguments validated straight from JSON: an object
+            of keyword arguments, or an array of positional arguments.
+
+            The JSON is parsed and validated in one pass by pydantic-core (without
+            building Python objects to validate first), and invalid JSON is captured
+            as a `ValidationError` like any other invalid arguments.
+            """
+            row_adapter = adapters()[1]
+            reported = structured and reporter.is_enabled()
+            validate_row = partial(row_adapter.validate_json, raw)
+            return call_validated((raw,), None, None, validate_row, reported)
+
+        return map_rows, call_json
+
     if func:
         return validate(func)
     else:
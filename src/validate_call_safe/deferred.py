@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import sys
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+__all__ = ("register", "done", "pending", "warmup")
+
+_pending: set[Callable[[], None]] = set()
+"""The build functions of every function decorated with `defer=True` not yet called."""
+
+_lock = Lock()
+
+
+def register(build: Callable[[], None]) -> None:
+    """Track the build function of a deferred function, until `done` is called."""
+    with _lock:
+        _pending.add(build)
+
+
+def done(build: Callable[[], None]) -> None:
+    """Stop tracking the build function of a deferred function, once it has run."""
+    with _lock:
+        _pending.discard(build)
+
+
+def pending() -> int:
+    """The number of deferred functions whose validators are not yet built."""
+    return len(_pending)
+
+
+def gil_enabled() -> bool:
+    """Whether the GIL is enabled (it always is before Python 3.13)."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is None or is_gil_enabled()
+
+
+def warmup(functions: Iterable[Callable] | None = None, parallel: bool = True) -> int:
+    """Build the validators of functions decorated with `defer=True` ahead of their
+    first call, e.g. once a server has started but before it takes requests.
+
+    Args:
+        functions: The decorated functions to build (functions that aren't deferred, or
+                   are already built, are skipped), or `None` for all that are pending.
+        parallel: Whether to build them in a thread pool, where possible: building a
+                  schema holds the GIL, so they are only built in parallel on a
+                  free-threaded build of Python (threads are slower otherwise).
+
+    Returns:
+        The number of functions whose validators were built.
+    """
+    if functions is None:
+        with _lock:
+            builds = list(_pending)
+    else:
+        builds = [
+            build
+            for func in functions
+            if (build := getattr(func, "__vcs_build__", None)) in _pending
+        ]
+    if parallel and len(builds) > 1 and not gil_enabled():
+        with ThreadPoolExecutor() as pool:
+            # Consume the results to re-raise any error raised by a build
+            list(pool.map(lambda build: build(), builds))
+    else:
+        for build in builds:
+            build()
+    return len(builds)
@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import inspect
+import os
+from collections.abc import Callable, Hashable
+from threading import Lock
+from typing import Any, Literal, NamedTuple, get_args, get_type_hints
+
+from pydantic import ConfigDict, TypeAdapter, ValidationError
+from pydantic_core import ArgsKwargs, PydanticCustomError, core_schema
+
+from .signature import arguments_type, call_type, return_type, signature_config
+
+__all__ = (
+    "Engine",
+    "default_engine",
+    "core_validate_call",
+    "RegistryInfo",
+    "registry_info",
+    "registry_clear",
+    "retitled",
+    "shared_validate_call",
+)
+
+Engine = Literal["validate_call", "core"]
+
+default_engine: Engine = os.environ.get("VALIDATE_CALL_SAFE_ENGINE", "validate_call")
+"""The engine of decorators not given one (set by the `VALIDATE_CALL_SAFE_ENGINE`
+environment variable, e.g. to run a test suite against the other engine)."""
+
+
+def core_validate_call(
+    func: Callable,
+    body: Callable,
+    config: ConfigDict | None,
+    validate_return: bool,
+) -> Callable:
+    """Validate calls to `body` against the signature of `func`, as `validate_call` does,
+    but with its pydantic-core validators called directly.
+
+    The validator's call schema validates the arguments and calls `body` with them, so
+    for a plain function there is no Python frame between this function and the body.
+    The return value (if `validate_return`) is validated by a second validator, as
+    `validate_call` does, so that its errors are located the same (at `()`), and that of
+    a coroutine function once awaited.
+    """
+    f_config = signature_config(func, config)
+    # The validator's own method, rather than the `TypeAdapter`'s Python wrapper of it
+    validate = TypeAdapter(
+        call_type(func, body), config=f_config
+    ).validator.validate_python
+
+    if validate_return:
+        return_adapter = TypeAdapter(return_type(func), config=f_config)
+        validate_ret = return_adapter.validator.validate_python
+
+        if inspect.iscoroutinefunction(func):
+
+            async def validated_func(*args: Any, **kwargs: Any) -> Any:
+                return validate_ret(await validate(ArgsKwargs(args, kwargs)))
+
+        else:
+
+            def validated_func(*args: Any, **kwargs: Any) -> Any:
+                return validate_ret(validate(ArgsKwargs(args, kwargs)))
+
+    else:
+
+        def validated_func(*args: Any, **kwargs: Any) -> Any:
+            return validate(ArgsKwargs(args, kwargs))
+
+    return validated_func
+
+
+class SharedValidator(NamedTuple):
+    validate: Callable[[Any], Any]
+    "The validator's `validate_python` method."
+    title: str
+    "The title of the validator's errors (after the function it was built for)."
+
+
+class RegistryInfo(NamedTuple):
+    """Statistics of the registry of shared validators."""
+
+    hits: int
+    "Validators shared with a function, having been built for another."
+    misses: int
+    "Validators built (and registered, if their signature is hashable)."
+    currsize: int
+
+
+_registry: dict[Hashable, SharedValidator] = {}
+"""Validators shared by functions of the same signature, keyed on the signature."""
+
+_registry_lock = Lock()
+_hits = _misses = 0
+
+
+def registry_info() -> RegistryInfo:
+    return RegistryInfo(_hits, _misses, len(_registry))
+
+
+def registry_clear() -> None:
+    """Forget every shared validator (functions already using one keep it) and reset
+    the statistics."""
+    global _hits, _misses
+    with _registry_lock:
+        _registry.clear()
+        _hits = _misses = 0
+
+
+def shared_validator(
+    key: Hashable, build: Callable[[], SharedValidator]
+) -> SharedValidator:
+    """The validator registered for `key`, or else the one `build` makes (registered,
+    unless `key` is unhashable)."""
+    global _hits, _misses
+    try:
+        with _registry_lock:
+            validator = _registry.get(key)
+            if validator is not None:
+                _hits += 1
+                return validator
+    except TypeError:
+        key = None  # Unhashable annotations, defaults or config
+    validator = build()  # Building is slow, so isn't done holding the lock
+    with _registry_lock:
+        _misses += 1
+        if key is not None:
+            validator = _registry.setdefault(key, validator)
+    return validator
+
+
+def config_key(config: ConfigDict | None) -> Hashable:
+    return tuple(sorted((config or {}).items()))
+
+
+def arguments_key(func: Callable, config: ConfigDict | None) -> Hashable:
+    """The key of a function's arguments validator: each parameter's name, kind,
+    (resolved) annotation and default (and its type, as e.g. `1 == True`), and the
+    config."""
+    hints = get_type_hints(func, include_extras=True)
+    params = tuple(
+        (
+            param.name,
+            param.kind,
+            hints.get(param.name, Any),
+            param.default,
+            type(param.default),
+        )
+        for param in inspect.signature(func).parameters.values()
+    )
+    return "arguments", params, config_key(config)
+
+
+def return_key(func: Callable, config: ConfigDict | None) -> Hashable:
+    """The key of a function's return validator: its return annotation and the config."""
+    annotation = get_type_hints(func, include_extras=True).get("return", Any)
+    return "return", annotation, config_key(config)
+
+
+KNOWN_ERROR_TYPES = frozenset(get_args(core_schema.ErrorType))
+
+
+def retitled(e: ValidationError, title: str, hide_input: bool) -> ValidationError:
+    """A copy of a `ValidationError` with another title, for an error raised by a
+    validator shared with a function other than the one it was built for.
+
+    Each error is rebuilt from its type and context (errors of a custom type from their
+    message, which has already been formatted with the context).
+    """
+    line_errors = []
+    for error in e.errors(include_url=False):
+        error_type, ctx = error["type"], error.get("ctx")
+        if error_type not in KNOWN_ERROR_TYPES:
+            error_type = PydanticCustomError(error_type, error["msg"], ctx)
+        details = {"type": error_type, "loc": error["loc"], "input": error["input"]}
+        if ctx is not None:
+            details["ctx"] = ctx
+        line_errors.append(details)
+    return ValidationError.from_exception_data(
+        title, line_errors, hide_input=hide_input
+    )
+
+
+def shared_validate_call(
+    func: Callable,
+    body: Callable,
+    config: ConfigDict | None,
+    validate_return: bool,
+) -> Callable:
+    """Validate calls to `body` against the signature of `func`, as `validate_call` does,
+    with validators shared by every function with the same signature and config.
+
+    The arguments validator (and the return validator) are looked up in a registry
+    keyed on the signature, and only built for the first function with it. Their errors
+    are titled after that function, so for any other they are retitled when raised,
+    which makes its invalid calls a little slower.
+    """
+    f_config = signature_config(func, config)
+    title = f_config["title"]
+    hide_input = bool(f_config.get("hide_input_in_errors"))
+
+    def build(validated_type: Any) -> Callable[[], SharedValidator]:
+        def build_validator() -> SharedValidator:
+            validator = TypeAdapter(validated_type, config=f_config).validator
+            return SharedValidator(validator.validate_python, title)
+
+        return build_validator
+
+    args_validator = shared_validator(
+        arguments_key(func, config), build(arguments_type(func))
+    )
+    validate_args = args_validator.validate
+    # The title to give the validators' errors, if they were built for another function
+    args_retitle = None if args_validator.title == title else title
+    if validate_return:
+        ret_validator = shared_validator(
+            return_key(func, config), build(return_type(func))
+        )
+        validate_ret = ret_validator.validate
+        ret_retitle = None if ret_validator.title == title else title
+    else:
+        validate_ret = ret_retitle = None
+
+    def validated_return(ret: Any) -> Any:
+        try:
+            return validate_ret(ret)
+        except ValidationError as e:
+            if ret_retitle is None:
+                raise
+            raise retitled(e, ret_retitle, hide_input) from None
+
+    if inspect.iscoroutinefunction(func) and validate_ret:
+
+        async def validated_func(*args: Any, **kwargs: Any) -> Any:
+            try:
+                args, kwargs = validate_args(ArgsKwargs(args, kwargs))
+            except ValidationError as e:
+                if args_retitle is None:
+                    raise
+                raise retitled(e, args_retitle, hide_input) from None
+            return validated_return(await body(*args, **kwargs))
+
+    else:
+
+        def validated_func(*args: Any, **kwargs: Any) -> Any:
+            try:
+                args, kwargs = validate_args(ArgsKwargs(args, kwargs))
+            except ValidationError as e:
+                if args_retitle is None:
+                    raise
+                raise retitled(e, args_retitle, hide_input) from None
+            if validate_ret:
+                return validated_return(body(*args, **kwargs))
+            return body(*args, **kwargs)
+
+    return validated_func
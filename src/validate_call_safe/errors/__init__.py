@@ -1,4 +1,4 @@
 from .details import ErrorDetails
-from .model import ErrorModel
+from .model import ErrorModel, LazyErrorModel
 
-__all__ = ("ErrorModel", "ErrorDetails")
+__all__ = ("ErrorModel", "ErrorDetails", "LazyErrorModel")
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TypeVar
+
+from pydantic import BaseModel
+from pydantic.functional_validators import (
+    AfterValidator,
+    BeforeValidator,
+    PlainValidator,
+    WrapValidator,
+)
+
+from .fields import ERROR_FIELDS
+from .model import ErrorModel
+
+__all__ = ("has_validators", "trusted_constructor")
+
+M = TypeVar("M", bound=BaseModel)
+
+_object_setattr = object.__setattr__
+
+FIELD_VALIDATOR_TYPES = (AfterValidator, BeforeValidator, PlainValidator, WrapValidator)
+
+
+def has_validators(model_cls: type[BaseModel]) -> bool:
+    """Whether a model has any validators of its own (field or model validators, by
+    decorator or in the `Annotated` metadata of a field), which construction skips."""
+    decorators = model_cls.__pydantic_decorators__
+    return bool(
+        decorators.field_validators
+        or decorators.model_validators
+        or decorators.validators
+        or decorators.root_validators
+        or any(
+            isinstance(metadata, FIELD_VALIDATOR_TYPES)
+            for field in model_cls.model_fields.values()
+            for metadata in field.metadata
+        )
+    )
+
+
+def trusted_constructor(error_model: type[M]) -> Callable[[dict], M]:
+    """Make a function building an error model from trusted data, without validation.
+
+    The data must be as the decorator builds it: the `ErrorModel` fields the model has,
+    in `ErrorModel` order. A model with only such fields (in that order), and nothing
+    else to initialise (no extra fields, private attributes or `model_post_init`) has
+    its instance state set directly, as `model_construct` would. Any other model is
+    built by `model_construct` itself, which is slower as it looks up every field.
+
+    A model with validators (say, one redacting the `error_str`) is still validated,
+    as they would be skipped by construction.
+    """
+    if has_validators(error_model):
+        return error_model.model_validate
+    fields = list(error_model.model_fields)
+    simple = (
+        fields == [name for name in ErrorModel.model_fields if name in fields]
+        and ERROR_FIELDS.issuperset(fields)
+        and error_model.model_config.get("extra") != "allow"
+        and not error_model.__pydantic_post_init__
+        and not error_model.__pydantic_root_model__
+    )
+    if not simple:
+
+        def construct(error_data: dict) -> M:
+            return error_model.model_construct(**error_data)
+
+        return construct
+
+    new = error_model.__new__
+
+    def construct(error_data: dict) -> M:
+        model = new(error_model)
+        _object_setattr(model, "__dict__", error_data)
+        _object_setattr(model, "__pydantic_fields_set__", set(error_data))
+        _object_setattr(model, "__pydantic_extra__", None)
+        _object_setattr(model, "__pydantic_private__", None)
+        return model
+
+    return construct
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from typing import Any, Literal, get_args, get_origin
+
+from pydantic import BaseModel
+
+__all__ = ("ErrorCoverageWarning", "error_type_dispatch", "uncovered_error_types")
+
+
+class ErrorCoverageWarning(UserWarning):
+    """Warned when an error model union can't model every error it may be given."""
+
+
+def error_type_dispatch(error_model: Any) -> dict[str, type[BaseModel]] | None:
+    """Map each error type to the member of a union of error models that models it.
+
+    This is only possible when every member is a model class with a `Literal` error type
+    (and no error type is claimed by two members): the error type then discriminates the
+    members, so the one to validate is known without trying the others. Returns `None`
+    for any other union, which is validated as a whole.
+    """
+    dispatch = {}
+    for member in get_args(error_model):
+        if not (isinstance(member, type) and issubclass(member, BaseModel)):
+            return None
+        field = member.model_fields.get("error_type")
+        if field is None or get_origin(field.annotation) is not Literal:
+            return None
+        for error_type in get_args(field.annotation):
+            if error_type in dispatch:
+                return None
+            dispatch[error_type] = member
+    return dispatch
+
+
+def uncovered_error_types(
+    covered: set[str],
+    validate_body: bool,
+    extra_exceptions: type[BaseException] | tuple[type[BaseException], ...],
+) -> list[str]:
+    """The error types the decorator may capture which are not in `covered`.
+
+    A `ValidationError` can always be captured, as can any exception in `extra_exceptions`
+    (with `validate_body`). Subclasses of an exception class are named for themselves,
+    so a class with subclasses can't be covered by its name alone.
+    """
+    uncovered = [] if "ValidationError" in covered else ["ValidationError"]
+    if validate_body:
+        if not isinstance(extra_exceptions, tuple):
+            extra_exceptions = (extra_exceptions,)
+        for exc_type in extra_exceptions:
+            name = exc_type.__name__
+            has_subclasses = bool(exc_type.__subclasses__())
+            if name not in covered:
+                uncovered.append(f"{name} (or a subclass)" if has_subclasses else name)
+            elif has_subclasses:
+                uncovered.append(f"subclasses of {name}")
+    return uncovered
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import types
+from typing import Annotated, Any, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+from .model import ErrorModel
+
+__all__ = ("error_model_fields", "error_model_classes")
+
+ERROR_FIELDS = frozenset(ErrorModel.model_fields)
+# A `LazyErrorModel` holds the traceback to render, rather than the rendered `error_tb`
+CAPTURED_FIELDS = ERROR_FIELDS | {"error_traceback"}
+
+
+def error_model_fields(error_model: Any) -> frozenset[str]:
+    """The `ErrorModel` fields (or the `LazyErrorModel` `error_traceback`) which an error
+    model (or union of them) can hold.
+
+    `Annotated` error models are unwrapped to their model class, and the fields of each
+    member of a `Union` are pooled. A model which allows extra fields can hold any of them.
+    """
+    origin = get_origin(error_model)
+    if origin is Annotated:
+        return error_model_fields(get_args(error_model)[0])
+    elif origin is Union or (hasattr(types, "UnionType") and origin is types.UnionType):
+        return frozenset().union(*map(error_model_fields, get_args(error_model)))
+    elif isinstance(error_model, type) and issubclass(error_model, BaseModel):
+        fields = CAPTURED_FIELDS.intersection(error_model.model_fields)
+        if error_model.model_config.get("extra") == "allow":
+            return ERROR_FIELDS | fields
+        return fields
+    return ERROR_FIELDS
+
+
+def error_model_classes(error_model: Any) -> tuple[type[BaseModel], ...]:
+    """The model classes which an error model (or union of them) validates into, for
+    `isinstance` checks. `Annotated` error models are unwrapped to their model class."""
+    origin = get_origin(error_model)
+    if origin is Annotated:
+        return error_model_classes(get_args(error_model)[0])
+    elif origin is Union or (hasattr(types, "UnionType") and origin is types.UnionType):
+        return tuple(
+            cls for arg in get_args(error_model) for cls in error_model_classes(arg)
+        )
+    return (error_model,)
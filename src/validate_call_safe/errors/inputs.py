@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from pydantic import ValidationError
+
+__all__ = ("InputMode", "DetailsPolicy", "details_policy", "details_getter")
+
+InputMode = Literal["keep", "drop", "type", "truncate"]
+
+
+@dataclass(frozen=True, slots=True)
+class DetailsPolicy:
+    """How much of a `ValidationError` to keep in the error details of an error model.
+
+    The `input` of each error detail is the offending value itself, which may be (or be
+    part of) a whole request payload, kept alive for as long as the error model is:
+
+    - `"keep"`: the input as is (the default)
+    - `"drop"`: no input (`None`)
+    - `"type"`: the name of the input's type
+    - `"truncate"`: the `repr` of the input, truncated to `max_length` characters
+    """
+
+    input: InputMode = "keep"
+    max_length: int = 100
+    "Number of characters of the input's `repr` kept in the `truncate` mode."
+    include_url: bool = True
+    "Whether each error detail has the URL of its error type's documentation."
+    include_context: bool = True
+    "Whether each error detail has its context (which may hold the exception raised)."
+
+
+def details_policy(details: InputMode | DetailsPolicy) -> DetailsPolicy:
+    """The policy for a decorator's `details` argument, which may just name the mode."""
+    if isinstance(details, DetailsPolicy):
+        return details
+    elif details in ("keep", "drop", "type", "truncate"):
+        return DetailsPolicy(details)
+    raise ValueError(
+        "details must be 'keep', 'drop', 'type', 'truncate' or a DetailsPolicy, "
+        f"not {details!r}"
+    )
+
+
+def truncated_repr(value: Any, max_length: int) -> str:
+    text = repr(value)
+    return text if len(text) <= max_length else text[: max_length - 3] + "..."
+
+
+def details_getter(policy: DetailsPolicy) -> Callable[[ValidationError], list]:
+    """Make a function giving the error details of a `ValidationError` under `policy`."""
+    include_url = policy.include_url
+    include_context = policy.include_context
+    if policy.input == "keep":
+
+        def get_details(e: ValidationError) -> list:
+            return e.errors(include_url=include_url, include_context=include_context)
+
+        return get_details
+    elif policy.input == "drop":
+
+        def replace(value: Any) -> None:
+            return None
+
+    elif policy.input == "type":
+
+        def replace(value: Any) -> str:
+            return type(value).__name__
+
+    else:
+
+        def replace(value: Any) -> str:
+            return truncated_repr(value, policy.max_length)
+
+    def get_details(e: ValidationError) -> list:
+        details = e.errors(include_url=include_url, include_context=include_context)
+        for detail in details:
+            detail["input"] = replace(detail["input"])
+        return details
+
+    return get_details
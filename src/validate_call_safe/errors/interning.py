@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from functools import lru_cache
+from threading import Lock
+from typing import TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+__all__ = (
+    "INTERN_MAXSIZE",
+    "ErrorInterner",
+    "error_fingerprint",
+    "frozen_variant",
+    "unpickle_frozen",
+)
+
+M = TypeVar("M", bound=BaseModel)
+
+INTERN_MAXSIZE = 1024
+"""Default number of distinct errors to keep an interned error model for."""
+
+
+def error_fingerprint(e: BaseException) -> Hashable:
+    """A cheap fingerprint of an error, equal for errors of the same shape.
+
+    A `ValidationError` is fingerprinted by its title and the type and location of each
+    of its errors (not their inputs), and any other exception by its type and message.
+    """
+    if isinstance(e, ValidationError):
+        errors = e.errors(include_url=False, include_context=False)
+        return e.title, tuple((error["type"], error["loc"]) for error in errors)
+    return type(e), str(e)
+
+
+@lru_cache(maxsize=None)
+def frozen_variant(model_cls: type[M]) -> type[M]:
+    """A frozen subclass of an error model class, for instances shared between calls.
+
+    It is named after the class (e.g. `FrozenErrorModel`), not as it, so that it can't be
+    mistaken for it by name, and its instances pickle as a reference to the class they
+    are a variant of, so that they unpickle (in another process) as instances of the
+    variant of that class there.
+    """
+    name = f"Frozen{model_cls.__name__}"
+
+    def __reduce__(self):
+        return unpickle_frozen, (model_cls, self.__getstate__())
+
+    namespace = {
+        "__module__": model_cls.__module__,
+        "__qualname__": name,
+        "__reduce__": __reduce__,
+        "model_config": {**model_cls.model_config, "frozen": True},
+    }
+    return type(name, (model_cls,), namespace)
+
+
+def unpickle_frozen(model_cls: type[M], state: dict) -> M:
+    """Rebuild a pickled instance of the frozen variant of an error model class."""
+    frozen_cls = frozen_variant(model_cls)
+    model = frozen_cls.__new__(frozen_cls)
+    model.__setstate__(state)
+    return model
+
+
+class ErrorInterner:
+    """A bounded map from error fingerprints to a shared (frozen) error model for each,
+    counting the occurrences of each fingerprint.
+
+    The least recently seen fingerprint is forgotten (with its count) when full.
+    """
+
+    __slots__ = ("maxsize", "_entries", "_lock")
+
+    def __init__(self, maxsize: int = INTERN_MAXSIZE) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, list] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, fingerprint: Hashable) -> BaseModel | None:
+        """The interned error model for a fingerprint (counting an occurrence of it), or
+        `None` if there isn't one (raises `TypeError` if unhashable)."""
+        with self._lock:
+            entry = self._entries.get(fingerprint)
+            if entry is None:
+                return None
+            entry[1] += 1
+            self._entries.move_to_end(fingerprint)
+            return entry[0]
+
+    def add(self, fingerprint: Hashable, model: M) -> M:
+        """Intern a frozen copy of an error model (the first occurrence of a fingerprint)."""
+        frozen_cls = frozen_variant(type(model))
+        values = {**model.__dict__, **(model.__pydantic_extra__ or {})}
+        frozen = frozen_cls.model_construct(model.model_fields_set, **values)
+        with self._lock:
+            self._entries[fingerprint] = [frozen, 1]
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return frozen
+
+    def counts(self) -> dict[Hashable, int]:
+        """The number of occurrences of each fingerprint."""
+        with self._lock:
+            return {
+                fingerprint: count for fingerprint, (_, count) in self._entries.items()
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
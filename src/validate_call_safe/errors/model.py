@@ -1,8 +1,12 @@
-from pydantic import BaseModel
+from functools import cached_property
+from traceback import TracebackException
+from typing import Annotated, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, computed_field
 
 from .details import ErrorDetails
 
-__all__ = ("ErrorModel",)
+__all__ = ("ErrorModel", "LazyErrorModel")
 
 
 class ErrorModel(BaseModel):
@@ -11,3 +15,25 @@ class ErrorModel(BaseModel):
     error_str: str
     error_repr: str
     error_tb: str
+
+
+class LazyErrorModel(BaseModel):
+    """An `ErrorModel` whose traceback is only rendered when `error_tb` is first accessed
+    (or the model dumped), from the `TracebackException` captured with the error."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    error_type: str
+    error_details: list[ErrorDetails]
+    error_str: str
+    error_repr: str
+    error_traceback: Annotated[
+        Optional[TracebackException], Field(exclude=True, repr=False)
+    ] = None
+
+    @computed_field(repr=False)
+    @cached_property
+    def error_tb(self) -> str:
+        if self.error_traceback is None:
+            return ""
+        return "".join(self.error_traceback.format())
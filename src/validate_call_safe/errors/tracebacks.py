@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from itertools import count
+from traceback import (
+    TracebackException,
+    format_exc,
+    format_exception_only,
+    walk_tb,
+)
+from typing import Literal
+
+__all__ = (
+    "TracebackMode",
+    "TracebackPolicy",
+    "traceback_policy",
+    "format_limited",
+    "traceback_renderer",
+)
+
+TracebackMode = Literal["full", "limited", "lazy", "none"]
+
+
+@dataclass(frozen=True, slots=True)
+class TracebackPolicy:
+    """How the traceback of a captured error is given to the error model.
+
+    - `"full"`: rendered in full, with source lines (as `traceback.format_exc`).
+    - `"limited"`: rendered with only the innermost `limit` frames, and no source lines.
+    - `"lazy"`: captured as a `TracebackException`, rendered when first accessed (this
+      needs an error model holding it as its `error_traceback`, i.e. a `LazyErrorModel`).
+    - `"none"`: not captured at all (an empty `error_tb`).
+
+    An error model holding an `error_traceback` is given one to render lazily in every
+    mode but `none` (of only the innermost `limit` frames in the `limited` mode).
+    """
+
+    mode: TracebackMode = "full"
+    limit: int = 5
+    "Number of (innermost) frames rendered in the `limited` mode."
+    sample: int = 1
+    "Only capture the traceback of 1 in every `sample` errors (the rest get none)."
+
+
+def traceback_policy(traceback: TracebackMode | TracebackPolicy) -> TracebackPolicy:
+    """The policy for a decorator's `traceback` argument, which may just name the mode."""
+    if isinstance(traceback, TracebackPolicy):
+        policy = traceback
+    elif traceback in ("full", "limited", "lazy", "none"):
+        policy = TracebackPolicy(traceback)
+    else:
+        raise ValueError(
+            "traceback must be 'full', 'limited', 'lazy', 'none' or a TracebackPolicy, "
+            f"not {traceback!r}"
+        )
+    if policy.sample < 1:
+        raise ValueError(f"traceback sample must be at least 1, not {policy.sample}")
+    return policy
+
+
+def format_limited(e: BaseException, limit: int) -> str:
+    """Render the innermost `limit` frames of an exception's traceback, without looking
+    up their source lines (or following chained exceptions)."""
+    frames = list(walk_tb(e.__traceback__))[-limit:] if limit > 0 else []
+    lines = ["Traceback (most recent call last):\n"]
+    for frame, lineno in frames:
+        code = frame.f_code
+        lines.append(f'  File "{code.co_filename}", line {lineno}, in {code.co_name}\n')
+    lines.extend(format_exception_only(type(e), e))
+    return "".join(lines)
+
+
+def traceback_renderer(
+    policy: TracebackPolicy,
+    lazy: bool = False,
+) -> Callable[[BaseException], str | TracebackException | None]:
+    """Make a function giving the traceback of a captured error for the error model.
+
+    If `lazy`, this is a `TracebackException` for a `LazyErrorModel` to render later
+    (limited to the innermost frames in the `limited` mode), otherwise a rendered string.
+    It must be called from within the `except` clause handling the error (as the `full`
+    mode uses `format_exc`). Errors which aren't sampled get no traceback.
+    """
+    unsampled = None if lazy else ""
+    if policy.mode == "none":
+        return lambda e: unsampled
+    elif lazy:
+        limit = -policy.limit if policy.mode == "limited" else None
+
+        def render(e: BaseException) -> TracebackException:
+            return TracebackException(
+                type(e), e, e.__traceback__, limit=limit, lookup_lines=False
+            )
+
+    elif policy.mode == "limited":
+
+        def render(e: BaseException) -> str:
+            return format_limited(e, policy.limit)
+
+    else:
+
+        def render(e: BaseException) -> str:
+            return format_exc()
+
+    if policy.sample == 1:
+        return render
+
+    counter = count()
+
+    def render_sampled(e: BaseException) -> str | TracebackException | None:
+        return render(e) if next(counter) % policy.sample == 0 else unsampled
+
+    return render_sampled
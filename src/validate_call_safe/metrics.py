@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+import inspect
+from bisect import bisect_left
+from collections.abc import Callable
+from contextvars import ContextVar, Token
+from functools import wraps
+from time import perf_counter
+from typing import Any
+
+__all__ = (
+    "BUCKET_BOUNDS",
+    "Histogram",
+    "FunctionStats",
+    "registry",
+    "register",
+    "snapshot",
+    "reset",
+    "prometheus_text",
+    "timed_body",
+    "metered",
+    "start_call",
+    "end_call",
+)
+
+BUCKET_BOUNDS = tuple(1e-6 * 2**i for i in range(25))
+"""Upper bounds (in seconds) of the latency histogram buckets: 1µs doubling up to ~17s."""
+
+registry: dict[str, FunctionStats] = {}
+"""Stats of every function decorated with `metrics=True`, keyed by qualified name."""
+
+# The body time of the call in progress, for the wrapper to subtract from the total,
+# which is `None` outside of a call (e.g. when a stream yields an error model later on).
+# Context variables are per thread and per asyncio task, so concurrent calls don't mix.
+_body_time: ContextVar[float | None] = ContextVar("body_time", default=None)
+
+
+class Histogram:
+    """A latency histogram with fixed log-scale buckets (see `BUCKET_BOUNDS`).
+
+    The bucket counts are preallocated, so observing a time only increments counters.
+    """
+
+    __slots__ = ("counts", "sum")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(BUCKET_BOUNDS) + 1)  # The last bucket is unbounded
+        self.sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(BUCKET_BOUNDS, seconds)] += 1
+        self.sum += seconds
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {"counts": list(self.counts), "sum": self.sum, "count": self.count}
+
+    def reset(self) -> None:
+        self.counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.sum = 0.0
+
+
+class FunctionStats:
+    """Call counts and latencies of one decorated function (its `__vcs_stats__`).
+
+    Body errors are keyed by the `error_type` of the error model they were captured as.
+    The validation time of a call is all of its time outside of the function body, which
+    includes building any error model.
+
+    For (async) generator functions a call is the creation of the stream: errors yielded
+    in place of items later on are counted by kind, but don't make the call an error.
+    """
+
+    __slots__ = (
+        "name",
+        "calls",
+        "errors",
+        "raised",
+        "validation_errors",
+        "body_errors",
+        "validation_time",
+        "body_time",
+    )
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.reset()
+
+    def reset(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.raised = 0
+        self.validation_errors = 0
+        self.body_errors: dict[str, int] = {}
+        self.validation_time = Histogram()
+        self.body_time = Histogram()
+
+    def record_validation_error(self) -> None:
+        self.validation_errors += 1
+        if _body_time.get() is not None:
+            self.errors += 1
+
+    def record_body_error(self, error_type: str) -> None:
+        self.body_errors[error_type] = self.body_errors.get(error_type, 0) + 1
+        if _body_time.get() is not None:
+            self.errors += 1
+
+    @property
+    def successes(self) -> int:
+        return self.calls - self.errors - self.raised
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "successes": self.successes,
+            "errors": self.errors,
+            "raised": self.raised,
+            "validation_errors": self.validation_errors,
+            "body_errors": dict(self.body_errors),
+            "validation_time": self.validation_time.snapshot(),
+            "body_time": self.body_time.snapshot(),
+        }
+
+
+def register(func: Callable) -> FunctionStats:
+    """Create the stats for a decorated function, and add them to the registry."""
+    name = f"{func.__module__}.{func.__qualname__}"
+    stats = registry[name] = FunctionStats(name)
+    return stats
+
+
+def snapshot() -> dict[str, dict[str, Any]]:
+    """A copy of the stats of every registered function."""
+    return {name: stats.snapshot() for name, stats in registry.items()}
+
+
+def reset() -> None:
+    """Reset the stats of every registered function to zero."""
+    for stats in registry.values():
+        stats.reset()
+
+
+def prometheus_text(prefix: str = "validate_call_safe") -> str:
+    """The stats of every registered function, in the Prometheus text exposition format."""
+    lines = []
+
+    def header(name: str, kind: str, help_text: str) -> None:
+        lines.append(f"# HELP {prefix}_{name} {help_text}")
+        lines.append(f"# TYPE {prefix}_{name} {kind}")
+
+    header("calls_total", "counter", "Calls to the decorated function.")
+    for name, stats in registry.items():
+        lines.append(f'{prefix}_calls_total{{function="{name}"}} {stats.calls}')
+    header("errors_total", "counter", "Errors captured into error models.")
+    for name, stats in registry.items():
+        labels = f'function="{name}",kind="validation",error_type="ValidationError"'
+        lines.append(f"{prefix}_errors_total{{{labels}}} {stats.validation_errors}")
+        for error_type, count in stats.body_errors.items():
+            labels = f'function="{name}",kind="body",error_type="{error_type}"'
+            lines.append(f"{prefix}_errors_total{{{labels}}} {count}")
+    header("raised_total", "counter", "Errors raised out of the decorated function.")
+    for name, stats in registry.items():
+        lines.append(f'{prefix}_raised_total{{function="{name}"}} {stats.raised}')
+    for metric, help_text in [
+        ("validation_time", "Time spent outside the function body."),
+        ("body_time", "Time spent in the function body."),
+    ]:
+        header(f"{metric}_seconds", "histogram", help_text)
+        for name, stats in registry.items():
+            histogram = getattr(stats, metric)
+            cumulative = 0
+            for bound, count in zip(BUCKET_BOUNDS + ("+Inf",), histogram.counts):
+                cumulative += count
+                labels = f'function="{name}",le="{bound}"'
+                lines.append(
+                    f"{prefix}_{metric}_seconds_bucket{{{labels}}} {cumulative}"
+                )
+            labels = f'function="{name}"'
+            lines.append(f"{prefix}_{metric}_seconds_sum{{{labels}}} {histogram.sum}")
+            lines.append(f"{prefix}_{metric}_seconds_count{{{labels}}} {cumulative}")
+    return "\n".join(lines) + "\n"
+
+
+def timed_body(func: Callable, stats: FunctionStats) -> Callable:
+    """Wrap a function body to time it, for `validate_call` to call once validated."""
+    if inspect.iscoroutinefunction(func):
+
+        @wraps(func)
+        async def timed(*args: Any, **kwargs: Any) -> Any:
+            start = perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                elapsed = perf_counter() - start
+                stats.body_time.observe(elapsed)
+                _body_time.set(elapsed)
+
+    else:
+
+        @wraps(func)
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = perf_counter() - start
+                stats.body_time.observe(elapsed)
+                _body_time.set(elapsed)
+
+    return timed
+
+
+def metered(wrapper: Callable, stats: FunctionStats) -> Callable:
+    """Wrap a decorated function to count its calls and time what is not its body."""
+    if inspect.iscoroutinefunction(wrapper):
+
+        @wraps(wrapper)
+        async def metered_wrapper(*args: Any, **kwargs: Any) -> Any:
+            token = _body_time.set(0.0)
+            start = perf_counter()
+            try:
+                return await wrapper(*args, **kwargs)
+            except BaseException:
+                stats.raised += 1
+                raise
+            finally:
+                stats.calls += 1
+                elapsed = perf_counter() - start
+                stats.validation_time.observe(elapsed - _body_time.get())
+                _body_time.reset(token)
+
+    else:
+
+        @wraps(wrapper)
+        def metered_wrapper(*args: Any, **kwargs: Any) -> Any:
+            token = _body_time.set(0.0)
+            start = perf_counter()
+            try:
+                return wrapper(*args, **kwargs)
+            except BaseException:
+                stats.raised += 1
+                raise
+            finally:
+                stats.calls += 1
+                elapsed = perf_counter() - start
+                stats.validation_time.observe(elapsed - _body_time.get())
+                _body_time.reset(token)
+
+    return metered_wrapper
+
+
+def start_call() -> Token:
+    """Mark the start of a call made without `metered` (e.g. a row of a batch)."""
+    return _body_time.set(0.0)
+
+
+def end_call(stats: FunctionStats, token: Token, start: float) -> None:
+    """Count a call started with `start_call` at time `start`, and time what was not
+    its body."""
+    stats.calls += 1
+    elapsed = perf_counter() - start
+    stats.validation_time.observe(elapsed - _body_time.get())
+    _body_time.reset(token)
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import inspect
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import wraps
+from typing import Any, Literal
+
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import PydanticSerializationError, to_json
+
+from .adapters import get_type_adapter
+from .signature import return_type
+
+__all__ = ("JsonOutput", "output_policy", "json_serializer", "serialized")
+
+
+@dataclass(frozen=True, slots=True)
+class JsonOutput:
+    """How to serialize the results (and error models) of a function to JSON `bytes`.
+
+    The `include`/`exclude` field sets are those of error models (as for their
+    `model_dump_json`), so a response can leave out e.g. the traceback. Results are
+    serialized whole.
+    """
+
+    include: set[str] | dict | None = None
+    exclude: set[str] | dict | None = None
+    indent: int | None = None
+
+
+def output_policy(output: Literal["python", "json"] | JsonOutput) -> JsonOutput | None:
+    """The policy for a decorator's `output` argument, or `None` for Python objects."""
+    if isinstance(output, JsonOutput):
+        return output
+    elif output == "json":
+        return JsonOutput()
+    elif output == "python":
+        return None
+    raise ValueError(f"output must be 'python', 'json' or a JsonOutput, not {output!r}")
+
+
+def json_serializer(
+    func: Callable,
+    error_classes: tuple[type[BaseModel], ...],
+    policy: JsonOutput,
+) -> Callable[[Any], bytes]:
+    """Make a function serializing the results and error models of `func` to JSON.
+
+    The serializers are built up front: one for the return annotation of `func`, and one
+    per error model class. A value is given to its serializer by an `isinstance` check,
+    rather than to one serializer of their union, which (in pydantic 2.10) tries each
+    member in turn and is several times slower for any but the first. A result not
+    matching its type (e.g. an unvalidated return value) is serialized by inference
+    instead, without warning.
+
+    A value holding objects JSON can't represent (such as the exception in the `ctx` of
+    a `value_error` raised by a validator) is serialized again with those objects as
+    their `str`, as `ValidationError.json()` does, rather than raising.
+    """
+    dump_result = TypeAdapter(return_type(func)).dump_json
+    dump_errors = [(cls, get_type_adapter(cls).dump_json) for cls in error_classes]
+    include, exclude, indent = policy.include, policy.exclude, policy.indent
+
+    def dump(value: Any) -> bytes:
+        if isinstance(value, error_classes):
+            for cls, dump_error in dump_errors:
+                if isinstance(value, cls):
+                    return dump_error(
+                        value,
+                        include=include,
+                        exclude=exclude,
+                        indent=indent,
+                        warnings=False,
+                    )
+        return dump_result(value, indent=indent, warnings=False)
+
+    def serialize(value: Any) -> bytes:
+        try:
+            return dump(value)
+        except PydanticSerializationError:
+            if isinstance(value, error_classes):
+                return to_json(
+                    value, include=include, exclude=exclude, indent=indent, fallback=str
+                )
+            return to_json(value, indent=indent, fallback=str)
+
+    return serialize
+
+
+def serialized(wrapper: Callable, serialize: Callable[[Any], bytes]) -> Callable:
+    """Wrap a decorated function to serialize its result (or error model)."""
+    if inspect.iscoroutinefunction(wrapper):
+
+        @wraps(wrapper)
+        async def serialized_wrapper(*args: Any, **kwargs: Any) -> bytes:
+            return serialize(await wrapper(*args, **kwargs))
+
+    else:
+
+        @wraps(wrapper)
+        def serialized_wrapper(*args: Any, **kwargs: Any) -> bytes:
+            return serialize(wrapper(*args, **kwargs))
+
+    return serialized_wrapper
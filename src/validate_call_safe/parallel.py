@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Callable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Literal
+
+from pydantic_core import ArgsKwargs
+
+__all__ = ("ExecutorLike", "executor_for", "chunk_rows", "map_chunk")
+
+ExecutorLike = Executor | Literal["thread", "process"]
+
+CHUNKS_PER_WORKER = 4
+"""Default number of chunks to split a batch into per worker, to even out the load."""
+
+
+@contextmanager
+def executor_for(executor: ExecutorLike) -> Iterator[Executor]:
+    """Use a given executor as is, or create (and shut down) a pool of the named kind."""
+    if isinstance(executor, Executor):
+        yield executor
+    elif executor == "thread":
+        with ThreadPoolExecutor() as pool:
+            yield pool
+    elif executor == "process":
+        with ProcessPoolExecutor() as pool:
+            yield pool
+    else:
+        raise ValueError(
+            f"executor must be an Executor, 'thread' or 'process', not {executor!r}",
+        )
+
+
+def chunk_rows(
+    rows: list[ArgsKwargs],
+    chunksize: int | None = None,
+) -> list[list[tuple[tuple, dict | None]]]:
+    """Split rows into chunks to send to workers.
+
+    `ArgsKwargs` can't be pickled, so the rows are sent as `(args, kwargs)` pairs.
+    """
+    if chunksize is None:
+        n_chunks = (os.cpu_count() or 1) * CHUNKS_PER_WORKER
+        chunksize = max(1, -(-len(rows) // n_chunks))
+    pairs = [(row.args, row.kwargs) for row in rows]
+    return [pairs[i : i + chunksize] for i in range(0, len(pairs), chunksize)]
+
+
+def map_chunk(func: Callable, chunk: list[tuple[tuple, dict | None]]) -> list[Any]:
+    """Run a decorated function's `.map` on a chunk of rows, in a worker."""
+    return func.map([ArgsKwargs(args, kwargs) for args, kwargs in chunk])
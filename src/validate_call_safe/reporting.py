@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Literal, Protocol, runtime_checkable
+
+from .sampling import sampler
+
+__all__ = (
+    "CallEvent",
+    "StructuredReporter",
+    "LoggingReporter",
+    "MessageReporter",
+    "ReportMode",
+    "ReportPolicy",
+    "report_policy",
+    "TailSampledReporter",
+)
+
+ReportMode = Literal["errors"]
+
+
+@dataclass(slots=True)
+class CallEvent:
+    """A record of one call to a decorated function, given to a `StructuredReporter`.
+
+    Nothing is formatted when the event is created: the arguments and result are the
+    objects themselves, for the reporter to format (or not) as it sees fit.
+    """
+
+    function: str
+    "Name of the decorated function."
+    args: tuple
+    "Positional arguments the function was called with (before validation)."
+    kwargs: dict
+    "Keyword arguments the function was called with (before validation)."
+    result: Any
+    "The return value, or the error model if an error was captured."
+    duration: float
+    "Time taken by the call (including validation) in seconds."
+    outcome: Literal["success", "error"]
+    "Whether the call returned a value or an error model."
+
+
+@runtime_checkable
+class StructuredReporter(Protocol):
+    """A reporter that is given a `CallEvent` after each call, instead of a message.
+
+    Pass one as the `reporter` (with `report=True`) to skip the formatting of messages:
+    `is_enabled` is checked before each call, so disabled reporting costs next to nothing.
+    """
+
+    def is_enabled(self) -> bool:
+        """Whether to report the next call (like `logging.Logger.isEnabledFor`)."""
+        ...
+
+    def report(self, event: CallEvent) -> None:
+        """Report a call that has just finished."""
+        ...
+
+
+class LoggingReporter:
+    """A `StructuredReporter` logging calls to a `logging.Logger` at a given level.
+
+    Messages are only formatted by the logger when a record is actually emitted.
+    """
+
+    def __init__(self, logger: logging.Logger, level: int = logging.INFO) -> None:
+        self.logger = logger
+        self.level = level
+
+    def is_enabled(self) -> bool:
+        return self.logger.isEnabledFor(self.level)
+
+    def report(self, event: CallEvent) -> None:
+        self.logger.log(
+            self.level,
+            "%s received *%r, **%r -> %s: %r (%.6fs)",
+            event.function,
+            event.args,
+            event.kwargs,
+            event.outcome,
+            event.result,
+            event.duration,
+        )
+
+
+class MessageReporter:
+    """A `StructuredReporter` giving a function the messages `report=True` reports.
+
+    This adapts a plain `reporter` (such as `print`) to be given only the calls that a
+    `ReportPolicy` picks, with their messages formatted once the call is picked.
+    """
+
+    def __init__(self, reporter: Callable[[str], None]) -> None:
+        self.reporter = reporter
+
+    def is_enabled(self) -> bool:
+        return True
+
+    def report(self, event: CallEvent) -> None:
+        self.reporter(f"{event.function} received *{event.args}, **{event.kwargs}")
+        if event.outcome == "success":
+            ret_t_name = type(event.result).__name__
+            self.reporter(f"{event.function} -> {ret_t_name}: {event.result!r}")
+        else:
+            self.reporter(f"{event.function} -> {event.result!r}")
+
+
+@dataclass(frozen=True, slots=True)
+class ReportPolicy:
+    """Which calls to report, decided once each call has finished ("tail sampling").
+
+    A call is reported if it meets any of the criteria, so for instance the default
+    policy reports every error and nothing else.
+    """
+
+    errors: bool = True
+    "Whether to report every call returning an error model."
+    slower_than: float | None = None
+    "Report every call taking at least this many seconds (`None` for none)."
+    successes: float | int = 0
+    "Report a fraction, or every Nth, of the other successful calls (`0` for none)."
+
+
+def report_policy(report: bool | ReportMode | ReportPolicy) -> ReportPolicy | None:
+    """The policy for a decorator's `report` argument, or `None` to report every call
+    (or none, if `report` is false)."""
+    if isinstance(report, ReportPolicy):
+        return report
+    elif report == "errors":
+        return ReportPolicy()
+    elif report is True or report is False:
+        return None
+    raise ValueError(
+        f"report must be a bool, 'errors' or a ReportPolicy, not {report!r}"
+    )
+
+
+class TailSampledReporter:
+    """A `StructuredReporter` reporting only the calls a `ReportPolicy` picks to another.
+
+    The decision is made after each call, from its outcome and duration, so nothing is
+    formatted for the calls that aren't reported.
+    """
+
+    def __init__(self, reporter: StructuredReporter, policy: ReportPolicy) -> None:
+        self.reporter = reporter
+        self.policy = policy
+        self._report_successes = bool(policy.successes)
+        self._sample_success = (
+            sampler(policy.successes, "successes") if policy.successes else None
+        )
+
+    def is_enabled(self) -> bool:
+        return self.reporter.is_enabled()
+
+    def report(self, event: CallEvent) -> None:
+        policy = self.policy
+        if event.outcome == "error":
+            picked = policy.errors
+        else:
+            sample = self._sample_success
+            picked = self._report_successes and (sample is None or sample())
+        if picked or (
+            policy.slower_than is not None and event.duration >= policy.slower_than
+        ):
+            self.reporter.report(event)
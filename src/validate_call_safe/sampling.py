@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from itertools import count
+from random import random
+from typing import Any
+
+__all__ = ("sampler", "sampled")
+
+
+def sampler(rate: float | int, name: str = "rate") -> Callable[[], bool] | None:
+    """Make a function deciding whether to sample each call, or `None` to sample all.
+
+    The `rate` is either a fraction of calls to sample at random (a `float` from 0 to 1),
+    or an `int` N to sample every Nth call (starting with the first).
+    """
+    if isinstance(rate, bool) or not isinstance(rate, (int, float)):
+        raise TypeError(f"{name} must be a float or int, not {rate!r}")
+    elif isinstance(rate, int):
+        if rate < 1:
+            raise ValueError(f"{name} must be at least 1 (every Nth call), not {rate}")
+        elif rate == 1:
+            return None
+        counter = count()
+
+        def every_nth() -> bool:
+            return next(counter) % rate == 0
+
+        return every_nth
+    elif not 0 <= rate <= 1:
+        raise ValueError(f"{name} must be a fraction from 0 to 1, not {rate}")
+    elif rate == 1:
+        return None
+
+    def at_random() -> bool:
+        return random() < rate
+
+    return at_random
+
+
+def sampled(
+    sampled_func: Callable,
+    unsampled_func: Callable,
+    should_sample: Callable[[], bool],
+) -> Callable:
+    """Call `sampled_func` for the calls sampled by `should_sample`, else `unsampled_func`.
+
+    Both are built up front, so deciding is all there is to do per call. The result
+    (a coroutine, for coroutine functions) is returned as it is, to be awaited.
+    """
+
+    def sampled_call(*args: Any, **kwargs: Any) -> Any:
+        if should_sample():
+            return sampled_func(*args, **kwargs)
+        return unsampled_func(*args, **kwargs)
+
+    return sampled_call
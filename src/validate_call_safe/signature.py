@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import types
+from typing import Annotated, Any, get_args, get_origin, get_type_hints
+from collections import abc
+from collections.abc import Callable
+
+from pydantic import ConfigDict, GetPydanticSchema
+from pydantic_core import ArgsKwargs, core_schema
+
+__all__ = (
+    "resolve_annotations",
+    "arguments_type",
+    "call_type",
+    "return_type",
+    "yield_type",
+    "signature_config",
+    "as_args_kwargs",
+)
+
+
+def resolve_annotations(func: Callable) -> Callable:
+    """A copy of `func` with its (possibly string) annotations evaluated.
+
+    Schemas generated here are not generated in the namespace of the function's module
+    (as `validate_call` does), so forward references must be resolved up front.
+    """
+    resolved = types.FunctionType(
+        func.__code__,
+        func.__globals__,
+        func.__name__,
+        func.__defaults__,
+        func.__closure__,
+    )
+    resolved.__kwdefaults__ = func.__kwdefaults__
+    resolved.__qualname__ = func.__qualname__
+    resolved.__module__ = func.__module__
+    resolved.__annotations__ = get_type_hints(func, include_extras=True)
+    return resolved
+
+
+def arguments_type(func: Callable) -> Any:
+    """A type validating `ArgsKwargs` against the signature of `func`, for `TypeAdapter`.
+
+    This is the same arguments schema that `validate_call` builds, but on its own rather
+    than as part of a call schema, so the validated `(args, kwargs)` are returned rather
+    than the function being called with them.
+    """
+    resolved = resolve_annotations(func)
+
+    def get_schema(_source: Any, handler) -> core_schema.CoreSchema:
+        schema = handler.generate_schema(resolved)["arguments_schema"]
+        # Arguments schemas have no serializer of their own, but TypeAdapter needs one
+        return {**schema, "serialization": core_schema.simple_ser_schema("any")}
+
+    return Annotated[Any, GetPydanticSchema(get_schema)]
+
+
+def call_type(func: Callable, body: Callable) -> Any:
+    """A type validating `ArgsKwargs` against the signature of `func` then calling `body`
+    with them, for `TypeAdapter`.
+
+    This is the call schema that `validate_call` builds for `func`, calling `body` in its
+    place. The return value is not validated by it: the call schema's own return schema
+    would locate errors at `('return',)`, where `validate_call` (validating it with a
+    validator of its own) locates them at `()`.
+    """
+    resolved = resolve_annotations(func)
+
+    def get_schema(_source: Any, handler) -> core_schema.CoreSchema:
+        arguments_schema = handler.generate_schema(resolved)["arguments_schema"]
+        return core_schema.call_schema(
+            arguments_schema,
+            body,
+            # Call schemas have no serializer of their own, but TypeAdapter needs one
+            serialization=core_schema.simple_ser_schema("any"),
+        )
+
+    return Annotated[Any, GetPydanticSchema(get_schema)]
+
+
+def return_type(func: Callable) -> Any:
+    """A type validating the return annotation of `func`, for `TypeAdapter`.
+
+    The annotation is wrapped so that the signature config can be applied to it even
+    when it is a model (as `validate_call` does), and string annotations are resolved.
+    """
+    annotation = get_type_hints(func, include_extras=True).get("return", Any)
+    return Annotated[
+        Any,
+        GetPydanticSchema(lambda _source, handler: handler.generate_schema(annotation)),
+    ]
+
+
+ITERATOR_ORIGINS = (
+    abc.Iterator,
+    abc.Iterable,
+    abc.Generator,
+    abc.AsyncIterator,
+    abc.AsyncIterable,
+    abc.AsyncGenerator,
+)
+
+
+def yield_type(func: Callable) -> Any | None:
+    """A type validating the items yielded by (async) generator function `func`.
+
+    The item type is taken from an `Iterator[T]`/`Generator[T, ...]` return annotation
+    (or their async/iterable counterparts), and is `None` if there is no such annotation.
+    """
+    annotation = get_type_hints(func, include_extras=True).get("return")
+    if get_origin(annotation) not in ITERATOR_ORIGINS or not get_args(annotation):
+        return None
+    item_annotation = get_args(annotation)[0]
+    return Annotated[
+        Any,
+        GetPydanticSchema(
+            lambda _source, handler: handler.generate_schema(item_annotation),
+        ),
+    ]
+
+
+def signature_config(func: Callable, config: ConfigDict | None) -> ConfigDict:
+    """The config to validate with, titled (like `validate_call`) after the function."""
+    return ConfigDict({"title": func.__qualname__, **(config or {})})
+
+
+def as_args_kwargs(row: tuple | dict | ArgsKwargs) -> ArgsKwargs:
+    """Normalise a row of arguments: a tuple of args, a dict of kwargs, or `ArgsKwargs`."""
+    if isinstance(row, ArgsKwargs):
+        return row
+    elif isinstance(row, dict):
+        return ArgsKwargs((), row)
+    else:
+        return ArgsKwargs(tuple(row))
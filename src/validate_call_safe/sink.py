@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import json
+import os
+from threading import Event, Lock, Thread
+from time import time
+from typing import Any
+
+from pydantic import BaseModel
+from pydantic_core import PydanticSerializationError, to_json
+
+__all__ = (
+    "SINK_CAPACITY",
+    "ErrorRing",
+    "Flusher",
+    "ring",
+    "enable",
+    "disable",
+    "flush",
+    "error_json",
+)
+
+SINK_CAPACITY = 1024
+"""Default number of error models the error sink keeps before overwriting the oldest."""
+
+ring: ErrorRing | None = None
+"""The error sink every decorated function pushes its error models into, once enabled."""
+
+
+class ErrorRing:
+    """A ring buffer of the last `capacity` error models captured, with when and where.
+
+    Its slots are preallocated, so pushing an error model (on the error path of a call)
+    only stores a reference to it: nothing is formatted or written until it is flushed.
+    Once full, each error pushed overwrites the oldest (counted in `dropped`).
+    """
+
+    __slots__ = (
+        "capacity",
+        "dropped",
+        "_entries",
+        "_pushed",
+        "_flushed",
+        "_lock",
+        "_flush_lock",
+    )
+
+    def __init__(self, capacity: int = SINK_CAPACITY) -> None:
+        if capacity < 1:
+            raise ValueError(f"capacity must be at least 1, not {capacity}")
+        self.capacity = capacity
+        self.dropped = 0
+        self._entries: list[tuple[float, str, Any] | None] = [None] * capacity
+        self._pushed = 0  # Errors pushed in all, so the next slot is this mod capacity
+        self._flushed = 0  # Errors pushed before the last flush (or drain)
+        self._lock = Lock()
+        # One flush (or drain) at a time, so no entry is written twice
+        self._flush_lock = Lock()
+
+    def __len__(self) -> int:
+        return min(self._pushed - self._flushed, self.capacity)
+
+    def push(self, function: str, error: Any) -> None:
+        with self._lock:
+            self._entries[self._pushed % self.capacity] = (time(), function, error)
+            self._pushed += 1
+
+    def drain(self) -> list[tuple[float, str, Any]]:
+        """Take the buffered entries (the time, function name and error model of each),
+        oldest first, emptying the buffer."""
+        with self._flush_lock, self._lock:
+            start = max(self._flushed, self._pushed - self.capacity)
+            self.dropped += start - self._flushed
+            entries = []
+            for i in range(start, self._pushed):
+                slot = i % self.capacity
+                entries.append(self._entries[slot])
+                self._entries[slot] = None  # Don't keep flushed error models alive
+            self._flushed = self._pushed
+        return entries
+
+    def flush(self, path: str | os.PathLike) -> int:
+        """Append the buffered errors to a JSONL file, in one write, emptying the buffer.
+
+        Each line is an object with the `time` (a Unix timestamp) of the error, the
+        `function` it was captured from, and the `error` model (by `model_dump_json`, or
+        as it is if the error model already serializes itself to a `str` or `bytes`).
+
+        The errors are only taken out of the buffer once written, so if the write fails
+        they are kept to be flushed again (unless overwritten in the meantime).
+
+        Returns:
+            The number of errors written.
+        """
+        with self._flush_lock:
+            with self._lock:
+                start = max(self._flushed, self._pushed - self.capacity)
+                end = self._pushed
+                self.dropped += start - self._flushed
+                self._flushed = start
+                entries = [self._entries[i % self.capacity] for i in range(start, end)]
+            if not entries:
+                return 0
+            lines = "".join(
+                f'{{"time":{timestamp!r},"function":{json.dumps(function)},'
+                f'"error":{error_json(error)}}}\n'
+                for timestamp, function, error in entries
+            )
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(lines)
+            with self._lock:
+                # The entries written, except any overwritten during the write
+                for i in range(max(start, self._pushed - self.capacity), end):
+                    self._entries[i % self.capacity] = None
+                self._flushed = end
+        return len(entries)
+
+    def start_flusher(self, path: str | os.PathLike, interval: float = 1.0) -> Flusher:
+        """Flush to `path` every `interval` seconds from a background (daemon) thread,
+        until its `stop` method is called."""
+        return Flusher(self, path, interval)
+
+
+def error_json(error: Any) -> str:
+    """The JSON of an error model, with any value JSON can't represent (such as the
+    exception in the `ctx` of a `value_error`) as its `str`."""
+    if isinstance(error, str):
+        return error
+    elif isinstance(error, bytes):
+        return error.decode()
+    elif isinstance(error, BaseModel):
+        try:
+            return error.model_dump_json()
+        except PydanticSerializationError:
+            pass
+    return to_json(error, fallback=str).decode()
+
+
+class Flusher:
+    """A daemon thread flushing an `ErrorRing` to a JSONL file at an interval.
+
+    Stopping it flushes the buffer a final time, so no error pushed before is lost.
+    """
+
+    def __init__(
+        self, ring: ErrorRing, path: str | os.PathLike, interval: float
+    ) -> None:
+        self.ring = ring
+        self.path = path
+        self.interval = interval
+        self.failures = 0
+        "Flushes that raised (their errors are kept in the ring, to be flushed again)."
+        self.last_failure: Exception | None = None
+        self._stopped = Event()
+        self._thread = Thread(target=self._run, name="vcs-error-flusher", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            try:
+                self.ring.flush(self.path)
+            except Exception as e:
+                # The thread must outlive e.g. a full disk, or errors pile up unflushed
+                self.failures += 1
+                self.last_failure = e
+
+    def stop(self) -> int:
+        """Stop the thread and flush what remains, returning the number of errors
+        written by that final flush."""
+        self._stopped.set()
+        self._thread.join()
+        return self.ring.flush(self.path)
+
+
+def enable(capacity: int = SINK_CAPACITY) -> ErrorRing:
+    """Start pushing the error models captured by every decorated function into a new
+    `ErrorRing` (replacing any existing one), and return it."""
+    global ring
+    ring = ErrorRing(capacity)
+    return ring
+
+
+def disable() -> ErrorRing | None:
+    """Stop pushing error models into the error sink, returning it (to be flushed)."""
+    global ring
+    disabled, ring = ring, None
+    return disabled
+
+
+def flush(path: str | os.PathLike) -> int:
+    """Flush the error sink to a JSONL file (see `ErrorRing.flush`), if it is enabled."""
+    return 0 if ring is None else ring.flush(path)
@@ -0,0 +1,5 @@
+from pytest import importorskip
+
+
+def test_coroutine():
+    importorskip("examples.async_funcs.coroutine")
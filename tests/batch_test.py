@@ -0,0 +1,9 @@
+from pytest import importorskip
+
+
+def test_map_rows():
+    importorskip("examples.batch.map_rows")
+
+
+def test_map_parallel():
+    importorskip("examples.batch.parallel")
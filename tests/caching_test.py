@@ -0,0 +1,9 @@
+from pytest import importorskip
+
+
+def test_memoize():
+    importorskip("examples.caching.memoize")
+
+
+def test_coalesce():
+    importorskip("examples.caching.coalesce")
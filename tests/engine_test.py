@@ -0,0 +1,47 @@
+import asyncio
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from pytest import mark
+
+from validate_call_safe import engine, validate_call_safe
+
+tests_dir = Path(__file__).parent
+
+
+@mark.skipif(engine.default_engine == "core", reason="Already using the core engine")
+def test_core_engine():
+    """The test suite (and the examples it imports) passes with the core engine too."""
+    env = {**os.environ, "VALIDATE_CALL_SAFE_ENGINE": "core"}
+    result = subprocess.run(
+        [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", tests_dir],
+        cwd=tests_dir.parent,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stdout
+
+
+@mark.parametrize("is_async", [False, True])
+def test_bad_return_parity(is_async):
+    """Return value errors have the same details with each engine (and when shared)."""
+    results = []
+    for kwargs in [{"engine": "validate_call"}, {"engine": "core"}, {"share": True}]:
+        if is_async:
+
+            async def bad_return(a: int) -> int:
+                return "not an int"
+
+        else:
+
+            def bad_return(a: int) -> int:
+                return "not an int"
+
+        func = validate_call_safe(validate_return=True, **kwargs)(bad_return)
+        result = asyncio.run(func(1)) if is_async else func(1)
+        results.append(result.error_details)
+    assert results[0][0]["loc"] == ()
+    assert results[1:] == results[:1] * 2
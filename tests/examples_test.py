@@ -57,3 +57,59 @@ def test_error_model_union_simple():
 
 def test_error_model_union_fallback():
     importorskip("examples.error_unions.error_model_fallback")
+
+
+def test_error_model_union_adapter_cache():
+    importorskip("examples.error_unions.adapter_cache")
+
+
+def test_error_model_union_dispatch():
+    importorskip("examples.error_unions.dispatch")
+
+
+def test_lean_error_model():
+    importorskip("examples.simple.lean_error_model")
+
+
+def test_trusted_error_model():
+    importorskip("examples.simple.trusted_error_model")
+
+
+def test_details_policy():
+    importorskip("examples.simple.details_policy")
+
+
+def test_interned_errors():
+    importorskip("examples.simple.interned_errors")
+
+
+def test_reporter_structured():
+    importorskip("examples.reporting.structured")
+
+
+def test_reporter_tail_sampled():
+    importorskip("examples.reporting.tail_sampled")
+
+
+def test_reporter_error_sink():
+    importorskip("examples.reporting.error_sink")
+
+
+def test_json_service():
+    importorskip("examples.validated_service.json_service")
+
+
+def test_json_output():
+    importorskip("examples.validated_service.json_output")
+
+
+def test_defer():
+    importorskip("examples.startup.defer")
+
+
+def test_shared_validators():
+    importorskip("examples.engines.shared")
+
+
+def test_validate_return_rate():
+    importorskip("examples.sampling.return_rate")
@@ -0,0 +1,5 @@
+from pytest import importorskip
+
+
+def test_stats():
+    importorskip("examples.metrics.stats")
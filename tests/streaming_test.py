@@ -0,0 +1,9 @@
+from pytest import importorskip
+
+
+def test_generator():
+    importorskip("examples.streaming.generator")
+
+
+def test_async_generator():
+    importorskip("examples.streaming.async_generator")
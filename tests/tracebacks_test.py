@@ -0,0 +1,5 @@
+from pytest import importorskip
+
+
+def test_policies():
+    importorskip("examples.tracebacks.policies")